@@ -156,15 +156,22 @@ class DiffractionDataInput(BaseModel):
     filename: str | None = Field(None, description="Original filename")
     sample_name: str | None = Field(None, description="Sample identifier")
 
+    @field_validator("q_values", "intensities", mode="before")
+    @classmethod
+    def convert_arrays(cls, v):
+        """Accept numpy arrays, converting them to lists in a single C pass."""
+        if isinstance(v, np.ndarray):
+            return v.tolist()
+        return v
+
     @field_validator("q_values", "intensities")
     @classmethod
     def validate_arrays(cls, v):
         """Ensure arrays are not empty and contain valid numbers."""
         if len(v) == 0:
             raise ValueError("Arrays cannot be empty")
-        if any(
-            not isinstance(x, (int, float)) or np.isnan(x) or np.isinf(x) for x in v
-        ):
+        # Elements are already validated as floats; check finiteness in bulk
+        if not np.isfinite(v).all():
             raise ValueError("Arrays must contain valid finite numbers")
         return v
 
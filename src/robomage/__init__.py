@@ -83,6 +83,7 @@ __license__ = "See LICENSE file"
 from .data.loaders import (
     load_chi_file,
     load_diffraction_file,
+    load_many,
     load_test_data,
 )
 from .data.models import (
@@ -110,6 +111,7 @@ __all__ = [
     # Modern API - recommended for new code
     "load_diffraction_file",
     "load_chi_file",
+    "load_many",
     "load_test_data",
     "DiffractionData",
     "DataStatistics",
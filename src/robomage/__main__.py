@@ -65,14 +65,16 @@ See Also:
 import argparse
 import sys
 from pathlib import Path
-
-import pandas as pd
+from typing import TYPE_CHECKING
 
 from .data_io import get_data_info, load_chi_file, load_test_data
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 def plot_data(
-    df: pd.DataFrame,
+    df: "pd.DataFrame",
     output_dir: str = ".",
     filename: str | None = None,
     show: bool = True,
@@ -155,7 +157,7 @@ def plot_data(
 
 
 def plot_multiple_data(
-    datasets: list[pd.DataFrame],
+    datasets: list["pd.DataFrame"],
     labels: list[str],
     output_dir: str = ".",
     filename: str | None = None,
@@ -0,0 +1,32 @@
+"""
+Filesystem locations used by RoboMage at runtime.
+"""
+
+import os
+from pathlib import Path
+
+
+def user_cache_dir(*parts: str) -> Path:
+    """
+    Return a per-user cache directory for RoboMage, without creating it.
+
+    ``$ROBOMAGE_CACHE_DIR`` overrides the location. Otherwise this is the
+    platform's user cache directory: ``%LOCALAPPDATA%\\robomage`` on Windows,
+    ``$XDG_CACHE_HOME/robomage`` (default ``~/.cache/robomage``) elsewhere.
+
+    Args:
+        *parts: Optional subdirectory names to append
+
+    Returns:
+        Path to the cache directory
+    """
+    override = os.environ.get("ROBOMAGE_CACHE_DIR")
+    if override:
+        base = Path(override)
+    elif os.name == "nt":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+        base = base / "robomage"
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+        base = base / "robomage"
+    return base.joinpath(*parts)
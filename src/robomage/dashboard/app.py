@@ -10,9 +10,14 @@ import sys
 
 import dash
 import dash_bootstrap_components as dbc
+import diskcache
+import flask
+from plotly.io.json import to_json_plotly
 
+from robomage._paths import user_cache_dir
 from robomage.dashboard.callbacks import analysis, file_upload, plotting
 from robomage.dashboard.layouts.main_layout import create_main_layout
+from robomage.dashboard.utils.data_cache import configure_data_cache
 
 # Add the project root to Python path for imports
 project_root = os.path.dirname(
@@ -22,27 +27,87 @@ if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
 
-def create_app(debug: bool = False) -> dash.Dash:
+def create_background_callback_manager(
+    directory: str | os.PathLike[str] | None = None,
+) -> dash.DiskcacheManager:
+    """
+    Create the manager used to run long callbacks outside the web worker.
+
+    Expensive callbacks (e.g. peak analysis) registered with ``background=True``
+    execute in a separate process, keeping the server responsive to other
+    interactions while they run.
+
+    Args:
+        directory: On-disk cache shared with the worker processes. Defaults
+            to ``background`` in the per-user RoboMage cache directory
+
+    Returns:
+        Diskcache-backed background callback manager
+    """
+    if directory is None:
+        directory = user_cache_dir("background")
+    return dash.DiskcacheManager(diskcache.Cache(str(directory)))
+
+
+def serve_precomputed_layout(app: dash.Dash) -> None:
+    """
+    Serve ``/_dash-layout`` from a JSON string serialized once.
+
+    The layout is static, so instead of Dash re-serializing the component
+    tree on every page load, the JSON is computed here and returned directly
+    from a ``before_request`` hook (responses are still compressed).
+
+    Args:
+        app: Dash application with its layout already set
+    """
+    layout_path = app.config.routes_pathname_prefix + "_dash-layout"
+    layout_json = to_json_plotly(app.get_layout())
+
+    @app.server.before_request
+    def _serve_layout():
+        if flask.request.method == "GET" and flask.request.path == layout_path:
+            return flask.Response(layout_json, mimetype="application/json")
+        return None
+
+
+def create_app(
+    debug: bool = False,
+    data_cache_dir: str | os.PathLike[str] | None = None,
+    background_cache_dir: str | os.PathLike[str] | None = None,
+) -> dash.Dash:
     """
     Create and configure the main Dash application.
 
     Args:
         debug: Enable debug mode for development
+        data_cache_dir: Directory for the server-side cache of uploaded
+            arrays. Defaults to a per-user cache directory
+        background_cache_dir: Directory for the background callback cache.
+            Defaults to a per-user cache directory
 
     Returns:
         Configured Dash application
     """
+    configure_data_cache(data_cache_dir)
+
     # Initialize Dash app with Bootstrap theme
     app = dash.Dash(
         __name__,
         external_stylesheets=[dbc.themes.BOOTSTRAP, dbc.icons.FONT_AWESOME],
         title="RoboMage Dashboard",
-        update_title="Loading...",
+        # Skip rewriting document.title to "Loading..." on every callback
+        update_title=None,
         suppress_callback_exceptions=True,
+        # Gzip/brotli layout, dependency and callback JSON (via flask-compress)
+        compress=True,
+        background_callback_manager=create_background_callback_manager(
+            background_cache_dir
+        ),
     )
 
     # Set the layout
     app.layout = create_main_layout()
+    serve_precomputed_layout(app)
 
     # Register callbacks
     file_upload.register_callbacks(app)
@@ -0,0 +1,125 @@
+/*
+ * RoboMage Dashboard clientside callbacks
+ *
+ * Pure view transforms that run in the browser, registered from Python via
+ * ClientsideFunction(namespace="robomage", function_name=...). They only touch
+ * data already on the page, so no server round-trip is needed.
+ */
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    robomage: {
+        /**
+         * Convert a plotly color to rgba with the given alpha.
+         * Mirrors color_to_rgba in callbacks/plotting.py.
+         */
+        colorToRgba: function (color, alpha) {
+            if (typeof color === "string" && color.startsWith("#")) {
+                const hex = color.slice(1);
+                const r = parseInt(hex.slice(0, 2), 16);
+                const g = parseInt(hex.slice(2, 4), 16);
+                const b = parseInt(hex.slice(4, 6), 16);
+                return `rgba(${r}, ${g}, ${b}, ${alpha})`;
+            }
+            if (typeof color === "string" && color.startsWith("rgb(")) {
+                return `rgba(${color.slice(4, -1)}, ${alpha})`;
+            }
+            return `rgba(128, 128, 128, ${alpha})`;
+        },
+
+        /**
+         * Restyle the data traces of the main plot for a new plot type
+         * (line, scatter, area). Peak marker traces are left untouched.
+         */
+        updatePlotType: function (plotType, figure) {
+            if (!figure || !figure.data) {
+                return window.dash_clientside.no_update;
+            }
+            const ns = window.dash_clientside.robomage;
+            let index = 0;
+            const data = figure.data.map(function (trace) {
+                if (trace.meta === "peak") {
+                    return trace;
+                }
+                const color =
+                    (trace.line && trace.line.color) ||
+                    (trace.marker && trace.marker.color);
+                const restyled = Object.assign({}, trace);
+                delete restyled.fill;
+                delete restyled.fillcolor;
+                if (plotType === "scatter") {
+                    restyled.mode = "markers";
+                    restyled.marker = {color: color, size: 4};
+                    restyled.line = {color: color, width: 2};
+                } else if (plotType === "area") {
+                    restyled.mode = "lines";
+                    restyled.fill = index > 0 ? "tonexty" : "tozeroy";
+                    restyled.fillcolor = ns.colorToRgba(color, 0.3);
+                    restyled.line = {color: color, width: 1};
+                } else {
+                    restyled.mode = "lines";
+                    restyled.line = {color: color, width: 2};
+                }
+                index += 1;
+                return restyled;
+            });
+            return Object.assign({}, figure, {data: data});
+        },
+
+        /**
+         * Poll the dashboard's service health route and return the status
+         * badge (children, color) and status bar (text, className) outputs.
+         * Mirrors SERVICE_HEALTH_ROUTE in callbacks/analysis.py.
+         */
+        checkServiceHealth: async function (activeTab, nIntervals) {
+            const config = JSON.parse(
+                document.getElementById("_dash-config").textContent
+            );
+            let healthy = false;
+            try {
+                const response = await fetch(
+                    config.requests_pathname_prefix + "api/health"
+                );
+                healthy = response.ok && (await response.json()).ok === true;
+            } catch (error) {
+                healthy = false;
+            }
+            const icon = function (className) {
+                return {
+                    type: "I",
+                    namespace: "dash_html_components",
+                    props: {className: className},
+                };
+            };
+            if (healthy) {
+                return [
+                    [icon("fas fa-check-circle me-1"), "Connected"],
+                    "success",
+                    "Connected",
+                    "text-success",
+                ];
+            }
+            return [
+                [icon("fas fa-times-circle me-1"), "Not Connected"],
+                "warning",
+                "Not Connected",
+                "text-warning",
+            ];
+        },
+
+        /**
+         * Toggle browser fullscreen on the card that holds the main plot.
+         */
+        toggleFullscreen: function (nClicks) {
+            const graph = document.getElementById("main-plot");
+            if (nClicks && graph) {
+                const target = graph.closest(".card") || graph;
+                if (document.fullscreenElement) {
+                    document.exitFullscreen();
+                } else if (target.requestFullscreen) {
+                    target.requestFullscreen();
+                }
+            }
+            return window.dash_clientside.no_update;
+        },
+    },
+});
@@ -8,77 +8,107 @@ Provides real-time peak detection, parameter controls, and results visualization
 from typing import Any
 
 import dash_bootstrap_components as dbc
-from dash import Input, Output, State, html
+import flask
+import numpy as np
+from dash import ClientsideFunction, Input, Output, State, html, no_update
 
 from robomage.clients.peak_analysis_client import (
     PeakAnalysisClient,
     PeakAnalysisServiceError,
 )
+from robomage.dashboard.layouts.main_layout import create_analysis_controls
+from robomage.dashboard.utils.data_cache import hydrate_file_data
+
+# Marks the controls slot once the real controls have been rendered
+ANALYSIS_CONTROLS_LOADED = "analysis-controls-loaded"
+
+# Lightweight JSON endpoint polled by the browser for service status
+SERVICE_HEALTH_ROUTE = "api/health"
 
 
 def register_callbacks(app):
     """Register all analysis related callbacks."""
     register_service_health_callback(app)
+    register_analysis_controls_callback(app)
     register_analysis_callback(app)
-    register_service_status_update(app)
 
 
 def register_service_health_callback(app):
-    """Register callback to check service health status."""
+    """
+    Register the service status check.
 
-    @app.callback(
+    The browser polls a small Flask route (see ``register_service_health_route``)
+    from a clientside callback on tab changes and every ``service-poll``
+    interval, so no Dash callback runs on the server per status check.
+    """
+    register_service_health_route(app)
+
+    app.clientside_callback(
+        ClientsideFunction(namespace="robomage", function_name="checkServiceHealth"),
         [
             Output("service-status-badge", "children"),
             Output("service-status-badge", "color"),
             Output("service-status", "children"),
             Output("service-status", "className"),
         ],
-        [Input("main-tabs", "active_tab")],
-        prevent_initial_call=False,
+        [
+            Input("main-tabs", "active_tab"),
+            Input("service-poll", "n_intervals"),
+        ],
     )
-    def check_service_health(active_tab):
+
+
+def register_service_health_route(app):
+    """Register the JSON route reporting peak analysis service health."""
+    # One pooled client for all polls instead of a new session per check
+    client = PeakAnalysisClient(timeout=2.0)
+
+    @app.server.route(app.config.routes_pathname_prefix + SERVICE_HEALTH_ROUTE)
+    def service_health():
         """
         Check if peak analysis service is available.
 
-        Args:
-            active_tab: Currently active tab ID
-
         Returns:
-            Tuple of (badge content, badge color, status text, status class)
+            JSON response ``{"ok": bool}``
         """
         try:
-            client = PeakAnalysisClient(timeout=2.0)
-            health = client.health_check()
-
-            if health.get("status") == "healthy":
-                return (
-                    [
-                        html.I(className="fas fa-check-circle me-1"),
-                        "Connected",
-                    ],
-                    "success",
-                    "Connected",
-                    "text-success",
-                )
+            healthy = client.health_check().get("status") == "healthy"
         except Exception:
-            pass
+            healthy = False
+
+        return flask.jsonify(ok=healthy)
 
-        return (
-            [
-                html.I(className="fas fa-times-circle me-1"),
-                "Not Connected",
-            ],
-            "warning",
-            "Not Connected",
-            "text-warning",
-        )
 
+def register_analysis_controls_callback(app):
+    """Register callback that renders the analysis controls on first data load."""
 
-def register_service_status_update(app):
-    """Register callback to update service connection status periodically."""
+    @app.callback(
+        [
+            Output("analysis-controls-slot", "children"),
+            Output("analysis-controls-slot", "className"),
+        ],
+        [Input("file-data-store", "data")],
+        [State("analysis-controls-slot", "className")],
+        prevent_initial_call=True,
+    )
+    def render_analysis_controls(file_data, slot_class):
+        """
+        Swap the placeholder for the analysis controls once a file is loaded.
 
-    # Use interval component if needed for periodic updates
-    # For now, status updates when switching tabs
+        The controls are rendered only once so later uploads do not reset
+        the user's parameter choices.
+
+        Args:
+            file_data: Loaded diffraction data from store
+            slot_class: Current class of the controls slot
+
+        Returns:
+            Tuple of (slot children, slot class)
+        """
+        if not file_data or slot_class == ANALYSIS_CONTROLS_LOADED:
+            return no_update, no_update
+
+        return [create_analysis_controls()], ANALYSIS_CONTROLS_LOADED
 
 
 def register_analysis_callback(app):
@@ -98,14 +128,37 @@ def register_analysis_callback(app):
             State("min-distance-input", "value"),
         ],
         prevent_initial_call=True,
+        # Run in a worker process so the server stays responsive during fits
+        background=True,
+        progress=[
+            Output("analysis-progress", "value"),
+            Output("analysis-progress", "label"),
+        ],
+        running=[
+            (Output("run-analysis-btn", "disabled"), True, False),
+            (
+                Output("analysis-progress", "style"),
+                {"visibility": "visible"},
+                {"visibility": "hidden"},
+            ),
+        ],
     )
     def run_peak_analysis(
-        n_clicks, file_data, sensitivity, profile, min_prominence, min_distance
+        set_progress,
+        n_clicks,
+        file_data,
+        sensitivity,
+        profile,
+        min_prominence,
+        min_distance,
     ):
         """
         Execute peak analysis on loaded diffraction data.
 
+        Runs as a background callback; progress is reported per analyzed file.
+
         Args:
+            set_progress: Background callback progress reporter
             n_clicks: Number of times button clicked
             file_data: Loaded diffraction data from store
             sensitivity: Peak detection sensitivity parameter
@@ -158,13 +211,17 @@ def register_analysis_callback(app):
 
             # Analyze each loaded file
             results = {}
-            for filename, data in file_data.items():
+            num_files = len(file_data)
+            for file_index, (filename, data) in enumerate(file_data.items()):
+                set_progress(
+                    (100 * file_index / num_files, f"{file_index}/{num_files}")
+                )
                 try:
-                    # Extract Q and intensity arrays
-                    # Note: file_data uses 'q' and 'intensity' keys
-                    # (from file_upload.py)
-                    q_values = data.get("q", [])
-                    intensities = data.get("intensity", [])
+                    # Extract Q and intensity arrays from the server-side
+                    # cache (the store only holds keys, see file_upload.py)
+                    data = hydrate_file_data(data) or {}
+                    q_values = np.asarray(data.get("q", [])).tolist()
+                    intensities = np.asarray(data.get("intensity", [])).tolist()
 
                     if not q_values or not intensities:
                         print(f"Skipping {filename}: missing data arrays")
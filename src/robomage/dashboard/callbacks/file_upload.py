@@ -7,14 +7,21 @@ Integrates with RoboMage data loaders for diffraction file support.
 
 import base64
 import io
+import re
+import warnings
 from typing import Any
 
 import dash
 import dash_bootstrap_components as dbc
-import pandas as pd
-from dash import Input, Output, State, html
+import numpy as np
+from dash import Input, Output, Patch, State, ctx, html, no_update
 from dash.dependencies import ALL
 
+from robomage.dashboard.utils.data_cache import cache_file_data, evict_file_data
+
+# Header/comment lines in uploaded files, collected into metadata
+_COMMENT_LINE = re.compile(r"^[ \t]*([#!].*?)[ \t\r]*$", re.MULTILINE)
+
 
 def register_callbacks(app: dash.Dash) -> None:
     """Register all file upload related callbacks."""
@@ -43,48 +50,92 @@ def register_file_upload_callbacks(app):
         list_of_names: list[str] | None,
         existing_data: dict[str, Any] | None,
     ) -> tuple[list[dict[str, Any]], dict[str, Any]]:
-        ctx = dash.callback_context
-        if not existing_data:
-            existing_data = {}
-        new_data = existing_data.copy()
-
-        # Determine what triggered the callback
-        if ctx.triggered:
-            prop_id = ctx.triggered[0]["prop_id"]
-            if prop_id.startswith("{") and "remove-file-btn" in prop_id:
-                # Remove file logic
-                filenames = list(new_data.keys())
-                for idx, n in enumerate(remove_clicks):
-                    if n and n > 0 and idx < len(filenames):
-                        filename_to_remove = filenames[idx]
-                        if filename_to_remove in new_data:
-                            del new_data[filename_to_remove]
-                        break
-            elif list_of_contents:
-                for content, name in zip(list_of_contents, list_of_names, strict=False):
-                    try:
-                        parsed = parse_uploaded_file(content, name)
-                        if parsed:
-                            new_data[name] = parsed
-                    except Exception as e:
-                        print(f"Error processing file {name}: {e}")
-                        continue
-        else:
-            from dash import no_update
+        """
+        Add uploaded files to, or remove a file from, the loaded data.
 
+        Once files are loaded, the store and file list are updated with
+        ``Patch`` so only the added/removed entries travel to the browser.
+        """
+        existing_data = existing_data or {}
+        trigger = ctx.triggered_id
+
+        if isinstance(trigger, dict) and trigger.get("type") == "remove-file-btn":
+            filename = trigger["filename"]
+            # Newly rendered buttons report n_clicks=0; only real clicks count
+            if not ctx.triggered[0]["value"] or filename not in existing_data:
+                return no_update, no_update, no_update, no_update
+            added: dict[str, Any] = {}
+            removed = [filename]
+        elif trigger == "upload-data" and list_of_contents:
+            added = {}
+            for content, name in zip(list_of_contents, list_of_names, strict=False):
+                try:
+                    parsed = parse_uploaded_file(content, name)
+                    if parsed:
+                        # Arrays stay on the server; the store gets a cache key
+                        added[name] = cache_file_data(parsed)
+                except Exception as e:
+                    print(f"Error processing file {name}: {e}")
+                    continue
+            if not added:
+                return no_update, no_update, no_update, no_update
+            removed = []
+        else:
             return no_update, no_update, no_update, no_update
 
-        # Create updated UI components
-        file_list = create_file_list(new_data)
-        file_info = create_file_info(new_data)
-        num_files = len(new_data)
-        if num_files == 0:
-            status = "No files loaded"
-        elif num_files == 1:
-            status = "Loaded 1 file"
+        for filename in [*removed, *added]:
+            if filename in existing_data:
+                evict_file_data(existing_data[filename])
+
+        new_data = {k: v for k, v in existing_data.items() if k not in removed}
+        new_data.update(added)
+        status = create_status_text(len(new_data))
+
+        # Switching between the empty placeholder and the list needs a rebuild
+        if not existing_data or not new_data:
+            file_list = create_file_list(new_data)
+            return new_data, file_list, create_file_info(new_data), status
+
+        data_patch = Patch()
+        list_patch = Patch()
+        list_items = list_patch[0]["props"]["children"]
+        filenames = list(existing_data)
+        for filename in removed:
+            del data_patch[filename]
+            del list_items[filenames.index(filename)]
+        for filename, parsed in added.items():
+            data_patch[filename] = parsed
+            item = create_file_list_item(filename, parsed)
+            if filename in existing_data:
+                list_items[filenames.index(filename)] = item
+            else:
+                list_items.append(item)
+
+        # File info describes the first file; skip it unless that changed
+        first_file = next(iter(new_data))
+        if first_file == filenames[0] and first_file not in added:
+            file_info = no_update
         else:
-            status = f"Loaded {num_files} files"
-        return new_data, file_list, file_info, status
+            file_info = create_file_info(new_data)
+
+        return data_patch, list_patch, file_info, status
+
+
+def create_status_text(num_files: int) -> str:
+    """
+    Create the status bar text for the number of loaded files.
+
+    Args:
+        num_files: Number of loaded files
+
+    Returns:
+        Status message
+    """
+    if num_files == 0:
+        return "No files loaded"
+    elif num_files == 1:
+        return "Loaded 1 file"
+    return f"Loaded {num_files} files"
 
 
 def parse_uploaded_file(content: str, filename: str) -> dict[str, Any] | None:
@@ -101,55 +152,44 @@ def parse_uploaded_file(content: str, filename: str) -> dict[str, Any] | None:
     try:
         # Decode the file content
         content_type, content_string = content.split(",")
-        decoded = base64.b64decode(content_string)
-
-        # Create a temporary file-like object
-        file_obj = io.StringIO(decoded.decode("utf-8"))
-
-        # Try to parse as diffraction data
-        # First, let's try to read it as a simple two-column format
-        lines = file_obj.getvalue().strip().split("\n")
-
-        # Skip comment lines and parse data
-        data_lines: list[list[float]] = []
-        metadata: dict[str, Any] = {"filename": filename, "comments": []}
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            if line.startswith("#") or line.startswith("!"):
-                metadata["comments"].append(line)
-                continue
-
-            # Try to parse as numeric data
-            try:
-                parts = line.split()
-                if len(parts) >= 2:
-                    q = float(parts[0])
-                    intensity = float(parts[1])
-                    data_lines.append([q, intensity])
-            except ValueError:
-                continue
-
-        if not data_lines:
+        text = base64.b64decode(content_string).decode("utf-8")
+
+        # Comment/header lines are kept as metadata
+        metadata: dict[str, Any] = {
+            "filename": filename,
+            "comments": _COMMENT_LINE.findall(text),
+        }
+
+        # Fast path: numpy's C parser handles the common clean two-column
+        # layout; irregular files fall back to tolerant line-by-line parsing
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", UserWarning)  # empty input
+                data_array = np.loadtxt(
+                    io.StringIO(text),
+                    comments=("#", "!"),
+                    usecols=(0, 1),
+                    ndmin=2,
+                    dtype=np.float64,
+                )
+        except ValueError:
+            data_array = _parse_data_lines(text)
+
+        if len(data_array) == 0:
             return None
 
-        # Convert to arrays
-        data_array = pd.DataFrame(data_lines, columns=["q", "intensity"])
+        q_values = data_array[:, 0]
+        intensities = data_array[:, 1]
 
         # Create data structure
         file_data = {
             "filename": filename,
-            "q": data_array["q"].tolist(),
-            "intensity": data_array["intensity"].tolist(),
+            "q": q_values.tolist(),
+            "intensity": intensities.tolist(),
             "metadata": metadata,
             "num_points": len(data_array),
-            "q_range": [data_array["q"].min(), data_array["q"].max()],
-            "intensity_range": [
-                data_array["intensity"].min(),
-                data_array["intensity"].max(),
-            ],
+            "q_range": [float(q_values.min()), float(q_values.max())],
+            "intensity_range": [float(intensities.min()), float(intensities.max())],
         }
 
         return file_data
@@ -159,6 +199,39 @@ def parse_uploaded_file(content: str, filename: str) -> dict[str, Any] | None:
         return None
 
 
+def _parse_data_lines(text: str) -> np.ndarray:
+    """
+    Parse two-column numeric data line by line, skipping anything else.
+
+    Used for files the fast ``np.loadtxt`` path rejects (stray text lines,
+    single-column rows, ...).
+
+    Args:
+        text: Decoded file content
+
+    Returns:
+        Array of shape (n, 2) with Q and intensity columns
+    """
+    data_lines: list[list[float]] = []
+
+    for line in text.strip().split("\n"):
+        line = line.strip()
+        if not line or line.startswith("#") or line.startswith("!"):
+            continue
+
+        # Try to parse as numeric data
+        try:
+            parts = line.split()
+            if len(parts) >= 2:
+                q = float(parts[0])
+                intensity = float(parts[1])
+                data_lines.append([q, intensity])
+        except ValueError:
+            continue
+
+    return np.array(data_lines, dtype=np.float64).reshape(-1, 2)
+
+
 def create_file_list(data: dict[str, Any]) -> list:
     """
     Create the file list component.
@@ -172,51 +245,64 @@ def create_file_list(data: dict[str, Any]) -> list:
     if not data:
         return [html.P("No files loaded", className="text-muted small")]
 
-    file_items = []
-    for filename, file_data in data.items():
-        file_items.append(
-            dbc.ListGroupItem(
+    file_items = [
+        create_file_list_item(filename, file_data)
+        for filename, file_data in data.items()
+    ]
+
+    return [dbc.ListGroup(file_items, flush=True)]
+
+
+def create_file_list_item(
+    filename: str, file_data: dict[str, Any]
+) -> dbc.ListGroupItem:
+    """
+    Create the file list entry for a single loaded file.
+
+    Args:
+        filename: Name of the loaded file
+        file_data: Parsed file data
+
+    Returns:
+        List group item with file summary and remove button
+    """
+    return dbc.ListGroupItem(
+        [
+            dbc.Row(
                 [
-                    dbc.Row(
+                    dbc.Col(
                         [
-                            dbc.Col(
-                                [
-                                    html.Strong(filename, className="small"),
-                                    html.Br(),
-                                    html.Small(
-                                        f"{file_data['num_points']} points",
-                                        className="text-muted",
-                                    ),
-                                ],
-                                width=8,
+                            html.Strong(filename, className="small"),
+                            html.Br(),
+                            html.Small(
+                                f"{file_data['num_points']} points",
+                                className="text-muted",
                             ),
-                            dbc.Col(
-                                [
-                                    dbc.Button(
-                                        html.I(className="fas fa-times"),
-                                        size="sm",
-                                        color="outline-danger",
-                                        id={
-                                            "type": "remove-file-btn",
-                                            "filename": filename,
-                                        },
-                                        n_clicks=0,
-                                        title="Remove file",
-                                    )
-                                ],
-                                width=4,
-                                className=(
-                                    "d-flex align-items-center justify-content-end"
-                                ),
-                            ),
-                        ]
-                    )
-                ],
-                id={"type": "file-item", "filename": filename},
+                        ],
+                        width=8,
+                    ),
+                    dbc.Col(
+                        [
+                            dbc.Button(
+                                html.I(className="fas fa-times"),
+                                size="sm",
+                                color="outline-danger",
+                                id={
+                                    "type": "remove-file-btn",
+                                    "filename": filename,
+                                },
+                                n_clicks=0,
+                                title="Remove file",
+                            )
+                        ],
+                        width=4,
+                        className=("d-flex align-items-center justify-content-end"),
+                    ),
+                ]
             )
-        )
-
-    return [dbc.ListGroup(file_items, flush=True)]
+        ],
+        id={"type": "file-item", "filename": filename},
+    )
 
 
 def create_file_info(data: dict[str, Any]) -> list:
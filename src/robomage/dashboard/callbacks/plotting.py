@@ -5,12 +5,74 @@ Handles interactive plotting and visualization for diffraction data.
 Creates publication-quality plots with customizable styling.
 """
 
+import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
-from dash import Input, Output, html
+from dash import (
+    ClientsideFunction,
+    Input,
+    Output,
+    State,
+    ctx,
+    dcc,
+    html,
+    no_update,
+)
+
+from robomage.dashboard.utils.data_cache import hydrate_file_data
+from robomage.dashboard.utils.downsampling import (
+    MAX_PLOT_POINTS,
+    downsample_trace,
+    get_viewport_range,
+)
+
+logger = logging.getLogger(__name__)
+
+# Static image export settings (publication-quality PNG)
+EXPORT_FILENAME = "diffraction_pattern.png"
+EXPORT_WIDTH = 800
+EXPORT_HEIGHT = 600
+EXPORT_SCALE = 2
+
+# Kaleido renders are expensive, so exports are funnelled through a single
+# worker thread rather than rendering concurrently per request.
+_EXPORT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export")
+
+# Traces with more points than this are drawn with WebGL (scattergl)
+WEBGL_POINT_THRESHOLD = 2000
+
+# Layout shared by every diffraction plot. Resolved through go.Figure once at
+# import (which also applies the default template) so callbacks can return
+# plain dicts without re-validating it.
+_AXIS_STYLE = {
+    "showgrid": True,
+    "gridwidth": 1,
+    "gridcolor": "lightgray",
+    "showline": True,
+    "linewidth": 1,
+    "linecolor": "black",
+    "mirror": True,
+}
+_BASE_LAYOUT = go.Figure(
+    layout={
+        "title": {
+            "text": "Powder Diffraction Pattern",
+            "x": 0.5,
+            "xanchor": "center",
+            "font": {"size": 16},
+        },
+        "xaxis": _AXIS_STYLE,
+        "yaxis": _AXIS_STYLE,
+        "plot_bgcolor": "white",
+        "paper_bgcolor": "white",
+        "font": {"family": "Arial, sans-serif", "size": 12},
+        "margin": {"l": 60, "r": 20, "t": 60, "b": 60},
+    }
+).to_plotly_json()["layout"]
 
 
 def register_callbacks(app):
@@ -18,6 +80,8 @@ def register_callbacks(app):
     register_main_plot_callback(app)
     register_plot_statistics_callback(app)
     register_peak_overlay_callback(app)
+    register_export_callback(app)
+    register_clientside_callbacks(app)
 
 
 def register_main_plot_callback(app):
@@ -25,17 +89,29 @@ def register_main_plot_callback(app):
 
     @app.callback(
         Output("main-plot", "figure"),
+        # Cleared on x-axis unit switches so later rebuilds don't reuse a
+        # zoom range recorded in the old units
+        Output("main-plot", "relayoutData"),
         [
             Input("file-data-store", "data"),
             Input("wavelength-store", "data"),
             Input("x-axis-selector", "value"),
             Input("y-axis-selector", "value"),
-            Input("plot-type-selector", "value"),
             Input("analysis-results-store", "data"),
+            Input("main-plot", "relayoutData"),
         ],
+        # Plot type changes are restyled in the browser (see
+        # register_clientside_callbacks); the server only reads it on rebuild.
+        State("plot-type-selector", "value"),
     )
     def update_main_plot(
-        file_data, wavelength_data, x_axis, y_axis, plot_type, analysis_results
+        file_data,
+        wavelength_data,
+        x_axis,
+        y_axis,
+        analysis_results,
+        relayout_data,
+        plot_type,
     ):
         """
         Update the main diffraction pattern plot with optional peak overlays.
@@ -45,17 +121,46 @@ def register_main_plot_callback(app):
             wavelength_data: Current wavelength settings
             x_axis: X-axis selection (q, two_theta, d_spacing)
             y_axis: Y-axis selection (raw, normalized, log)
-            plot_type: Plot type (line, scatter, area)
             analysis_results: Peak analysis results from service
+            relayout_data: Zoom/pan events, used to resample the viewport
+            plot_type: Plot type (line, scatter, area)
 
         Returns:
-            Updated plotly figure
+            Tuple of (updated plotly figure, relayoutData update)
         """
         if not file_data:
-            return create_empty_plot()
+            return create_empty_plot(), no_update
+
+        triggered = set(ctx.triggered_prop_ids)
+        relayout_update = no_update
+        if "x-axis-selector.value" in triggered:
+            # The last zoom range is in the old units: plot the full trace
+            # and forget the range
+            x_range = None
+            relayout_update = None
+        elif triggered == {"main-plot.relayoutData"}:
+            # Zoom/pan only needs a rebuild when traces are downsampled
+            x_changed = any(key.startswith("xaxis.") for key in relayout_data or {})
+            max_points = max(data["num_points"] for data in file_data.values())
+            if not x_changed or max_points <= MAX_PLOT_POINTS:
+                return no_update, no_update
+            x_range = get_viewport_range(relayout_data)
+        else:
+            # Keep resolution for the current zoom when other inputs change
+            x_range = get_viewport_range(relayout_data)
+
+        # The store holds cache keys; fetch the arrays from the server cache
+        file_data = {
+            filename: hydrated
+            for filename, data in file_data.items()
+            if (hydrated := hydrate_file_data(data)) is not None
+        }
+        if not file_data:
+            return create_empty_plot(), relayout_update
 
-        # Create the plot
-        fig = go.Figure()
+        # Figures are built as plain dicts: Dash serializes them directly,
+        # skipping plotly's per-property validation of every trace.
+        traces = []
 
         # Plot each loaded file
         colors = px.colors.qualitative.Set1
@@ -65,67 +170,36 @@ def register_main_plot_callback(app):
             # Get x and y data
             x_data, x_label = get_x_data(data, x_axis, wavelength_data)
             y_data, y_label = get_y_data(data, y_axis)
-
-            # Add trace based on plot type
+            x_data, y_data = downsample_trace(x_data, y_data, x_range)
+
+            trace = {
+                "type": (
+                    "scattergl" if len(x_data) > WEBGL_POINT_THRESHOLD else "scatter"
+                ),
+                "x": x_data,
+                "y": y_data,
+                "name": filename,
+                "hovertemplate": f"<b>{filename}</b><br>"
+                + f"{x_label}: %{{x:.3f}}<br>"
+                + f"{y_label}: %{{y:.0f}}<extra></extra>",
+            }
+
+            # Style trace based on plot type
             if plot_type == "line":
-                fig.add_trace(
-                    go.Scatter(
-                        x=x_data,
-                        y=y_data,
-                        mode="lines",
-                        name=filename,
-                        line=dict(color=color, width=2),
-                        hovertemplate=f"<b>{filename}</b><br>"
-                        + f"{x_label}: %{{x:.3f}}<br>"
-                        + f"{y_label}: %{{y:.0f}}<extra></extra>",
-                    )
-                )
+                trace["mode"] = "lines"
+                trace["line"] = {"color": color, "width": 2}
             elif plot_type == "scatter":
-                fig.add_trace(
-                    go.Scatter(
-                        x=x_data,
-                        y=y_data,
-                        mode="markers",
-                        name=filename,
-                        marker=dict(color=color, size=4),
-                        hovertemplate=f"<b>{filename}</b><br>"
-                        + f"{x_label}: %{{x:.3f}}<br>"
-                        + f"{y_label}: %{{y:.0f}}<extra></extra>",
-                    )
-                )
+                trace["mode"] = "markers"
+                trace["marker"] = {"color": color, "size": 4}
             elif plot_type == "area":
-                # Helper function to convert color to rgba with alpha
-                def color_to_rgba(color_str, alpha=0.3):
-                    """Convert color to rgba format with specified alpha."""
-                    if color_str.startswith("#"):
-                        # Hex color
-                        rgb_tuple = px.colors.hex_to_rgb(color_str)
-                        return (
-                            f"rgba({rgb_tuple[0]}, {rgb_tuple[1]}, {rgb_tuple[2]}, "
-                            f"{alpha})"
-                        )
-                    elif color_str.startswith("rgb("):
-                        # RGB color - extract numbers and add alpha
-                        rgb_values = color_str[4:-1]  # Remove 'rgb(' and ')'
-                        return f"rgba({rgb_values}, {alpha})"
-                    else:
-                        # Fallback to a default color
-                        return f"rgba(128, 128, 128, {alpha})"
-
-                fig.add_trace(
-                    go.Scatter(
-                        x=x_data,
-                        y=y_data,
-                        mode="lines",
-                        fill="tonexty" if i > 0 else "tozeroy",
-                        name=filename,
-                        line=dict(color=color, width=1),
-                        fillcolor=color_to_rgba(color, 0.3),
-                        hovertemplate=f"<b>{filename}</b><br>"
-                        + f"{x_label}: %{{x:.3f}}<br>"
-                        + f"{y_label}: %{{y:.0f}}<extra></extra>",
-                    )
-                )
+                trace["mode"] = "lines"
+                trace["fill"] = "tonexty" if i > 0 else "tozeroy"
+                trace["line"] = {"color": color, "width": 1}
+                trace["fillcolor"] = color_to_rgba(color, 0.3)
+            else:
+                continue
+
+            traces.append(trace)
 
         # Add peak annotations if analysis results available
         if analysis_results:
@@ -155,7 +229,7 @@ def register_main_plot_callback(app):
                             sin_theta = np.clip(
                                 peak_q * wavelength / (4 * np.pi), -1.0, 1.0
                             )
-                            peak_x = 2 * np.arcsin(sin_theta) * 180 / np.pi
+                            peak_x = float(2 * np.arcsin(sin_theta) * 180 / np.pi)
                         elif x_axis == "d_spacing":
                             peak_x = 2 * np.pi / peak_q
                         else:
@@ -169,27 +243,32 @@ def register_main_plot_callback(app):
                                 intensity_data.max(),
                             )
                             if max_val > min_val:
-                                peak_y = (peak_height - min_val) / (max_val - min_val)
+                                peak_y = float(
+                                    (peak_height - min_val) / (max_val - min_val)
+                                )
                             else:
                                 peak_y = peak_height
                         else:
                             peak_y = peak_height
 
                         # Add peak marker
-                        fig.add_trace(
-                            go.Scatter(
-                                x=[peak_x],
-                                y=[peak_y],
-                                mode="markers",
-                                marker=dict(
-                                    symbol="triangle-up",
-                                    size=10,
-                                    color="red",
-                                    line=dict(width=1, color="darkred"),
-                                ),
-                                name=f"Peak {peak.get('d_spacing', 0):.2f}Å",
-                                showlegend=False,
-                                hovertemplate=(
+                        traces.append(
+                            {
+                                "type": "scatter",
+                                "x": [peak_x],
+                                "y": [peak_y],
+                                "mode": "markers",
+                                "marker": {
+                                    "symbol": "triangle-up",
+                                    "size": 10,
+                                    "color": "red",
+                                    "line": {"width": 1, "color": "darkred"},
+                                },
+                                "name": f"Peak {peak.get('d_spacing', 0):.2f}Å",
+                                "showlegend": False,
+                                # Tag so clientside restyles skip peak markers
+                                "meta": "peak",
+                                "hovertemplate": (
                                     f"<b>Peak</b><br>"
                                     f"Q: {peak_q:.3f} Å⁻¹<br>"
                                     f"d: {peak.get('d_spacing', 0):.3f} Å<br>"
@@ -197,55 +276,61 @@ def register_main_plot_callback(app):
                                     f"Width: {peak.get('width', 0):.3f}<br>"
                                     "<extra></extra>"
                                 ),
-                            )
+                            }
                         )
 
-        # Update layout
-        fig.update_layout(
-            title={
-                "text": "Powder Diffraction Pattern",
-                "x": 0.5,
-                "xanchor": "center",
-                "font": {"size": 16},
+        layout = {
+            **_BASE_LAYOUT,
+            "xaxis": {
+                **_BASE_LAYOUT["xaxis"],
+                "title": {"text": x_label},
+                "uirevision": x_axis,
+            },
+            "yaxis": {
+                **_BASE_LAYOUT["yaxis"],
+                "title": {"text": y_label},
+                "type": "log" if y_axis == "log" else "linear",
+                "uirevision": y_axis,
+            },
+            "hovermode": "closest",
+            "legend": {
+                "yanchor": "top",
+                "y": 0.99,
+                "xanchor": "left",
+                "x": 0.01,
+                "bgcolor": "rgba(255, 255, 255, 0.8)",
+                "bordercolor": "gray",
+                "borderwidth": 1,
             },
-            xaxis=dict(
-                title=x_label,
-                showgrid=True,
-                gridwidth=1,
-                gridcolor="lightgray",
-                showline=True,
-                linewidth=1,
-                linecolor="black",
-                mirror=True,
-            ),
-            yaxis=dict(
-                title=y_label,
-                showgrid=True,
-                gridwidth=1,
-                gridcolor="lightgray",
-                showline=True,
-                linewidth=1,
-                linecolor="black",
-                mirror=True,
-                type="log" if y_axis == "log" else "linear",
-            ),
-            plot_bgcolor="white",
-            paper_bgcolor="white",
-            font={"family": "Arial, sans-serif", "size": 12},
-            hovermode="closest",
-            legend=dict(
-                yanchor="top",
-                y=0.99,
-                xanchor="left",
-                x=0.01,
-                bgcolor="rgba(255, 255, 255, 0.8)",
-                bordercolor="gray",
-                borderwidth=1,
-            ),
-            margin=dict(l=60, r=20, t=60, b=60),
-        )
-
-        return fig
+            # Preserve zoom across rebuilds until the axis units change
+            "uirevision": True,
+        }
+
+        return {"data": traces, "layout": layout}, relayout_update
+
+
+def color_to_rgba(color_str: str, alpha: float = 0.3) -> str:
+    """
+    Convert a plotly color to rgba format with the specified alpha.
+
+    Args:
+        color_str: Hex (``#rrggbb``) or ``rgb(r, g, b)`` color string
+        alpha: Opacity of the returned color
+
+    Returns:
+        rgba color string
+    """
+    if color_str.startswith("#"):
+        # Hex color
+        rgb_tuple = px.colors.hex_to_rgb(color_str)
+        return f"rgba({rgb_tuple[0]}, {rgb_tuple[1]}, {rgb_tuple[2]}, {alpha})"
+    elif color_str.startswith("rgb("):
+        # RGB color - extract numbers and add alpha
+        rgb_values = color_str[4:-1]  # Remove 'rgb(' and ')'
+        return f"rgba({rgb_values}, {alpha})"
+    else:
+        # Fallback to a default color
+        return f"rgba(128, 128, 128, {alpha})"
 
 
 def get_x_data(
@@ -323,63 +408,42 @@ def get_y_data(data: dict[str, Any], y_axis: str) -> tuple[list[float], str]:
         return intensity_data.tolist(), "Intensity (counts)"
 
 
-def create_empty_plot() -> go.Figure:
+def create_empty_plot() -> dict[str, Any]:
     """
     Create an empty plot placeholder.
 
     Returns:
-        Empty plotly figure
+        Empty plotly figure dictionary
     """
-    fig = go.Figure()
-
-    fig.add_annotation(
-        text="Upload diffraction data files to display patterns",
-        xref="paper",
-        yref="paper",
-        x=0.5,
-        y=0.5,
-        xanchor="center",
-        yanchor="middle",
-        showarrow=False,
-        font=dict(size=16, color="gray"),
-    )
-
-    fig.update_layout(
-        title={
-            "text": "Powder Diffraction Pattern",
-            "x": 0.5,
-            "xanchor": "center",
-            "font": {"size": 16},
+    return {
+        "data": [],
+        "layout": {
+            **_BASE_LAYOUT,
+            "annotations": [
+                {
+                    "text": "Upload diffraction data files to display patterns",
+                    "xref": "paper",
+                    "yref": "paper",
+                    "x": 0.5,
+                    "y": 0.5,
+                    "xanchor": "center",
+                    "yanchor": "middle",
+                    "showarrow": False,
+                    "font": {"size": 16, "color": "gray"},
+                }
+            ],
+            "xaxis": {
+                **_BASE_LAYOUT["xaxis"],
+                "title": {"text": "Q (Å⁻¹)"},
+                "range": [0, 10],
+            },
+            "yaxis": {
+                **_BASE_LAYOUT["yaxis"],
+                "title": {"text": "Intensity (counts)"},
+                "range": [0, 1000],
+            },
         },
-        xaxis=dict(
-            title="Q (Å⁻¹)",
-            showgrid=True,
-            gridwidth=1,
-            gridcolor="lightgray",
-            showline=True,
-            linewidth=1,
-            linecolor="black",
-            mirror=True,
-            range=[0, 10],
-        ),
-        yaxis=dict(
-            title="Intensity (counts)",
-            showgrid=True,
-            gridwidth=1,
-            gridcolor="lightgray",
-            showline=True,
-            linewidth=1,
-            linecolor="black",
-            mirror=True,
-            range=[0, 1000],
-        ),
-        plot_bgcolor="white",
-        paper_bgcolor="white",
-        font={"family": "Arial, sans-serif", "size": 12},
-        margin=dict(l=60, r=20, t=60, b=60),
-    )
-
-    return fig
+    }
 
 
 def register_plot_statistics_callback(app):
@@ -388,6 +452,8 @@ def register_plot_statistics_callback(app):
     @app.callback(
         Output("plot-statistics", "children"),
         [Input("file-data-store", "data")],
+        # The layout already renders the empty-state placeholder
+        prevent_initial_call=True,
     )
     def update_plot_statistics(file_data):
         """
@@ -404,7 +470,10 @@ def register_plot_statistics_callback(app):
 
         stats_items = []
 
-        for filename, data in file_data.items():
+        for filename, entry in file_data.items():
+            data = hydrate_file_data(entry)
+            if data is None:
+                continue
             q_data = np.array(data["q"])
             intensity_data = np.array(data["intensity"])
 
@@ -452,3 +521,90 @@ def register_peak_overlay_callback(app):
     # - Peak labeling options
     # - Fitted curve display
     pass
+
+
+def render_figure_png(figure: dict[str, Any]) -> bytes:
+    """
+    Render a figure to PNG bytes on the server using Kaleido.
+
+    Args:
+        figure: Plotly figure dictionary (as stored on the dcc.Graph)
+
+    Returns:
+        PNG image bytes
+    """
+    return go.Figure(figure).to_image(
+        format="png",
+        width=EXPORT_WIDTH,
+        height=EXPORT_HEIGHT,
+        scale=EXPORT_SCALE,
+    )
+
+
+def register_export_callback(app):
+    """Register the server-side plot export callback."""
+
+    @app.callback(
+        Output("plot-download", "data"),
+        Output("export-alert", "children"),
+        Output("export-alert", "is_open"),
+        Input("export-btn", "n_clicks"),
+        State("main-plot", "figure"),
+        prevent_initial_call=True,
+    )
+    def export_main_plot(n_clicks, figure):
+        """
+        Render the current plot to PNG and send it to the browser.
+
+        Rendering happens on the server so the browser never blocks on
+        client-side image generation for large traces.
+
+        Args:
+            n_clicks: Number of times the export button was clicked
+            figure: Current main plot figure
+
+        Returns:
+            Tuple of (download payload for the dcc.Download component,
+            export alert message, whether the alert is shown)
+        """
+        if not figure:
+            return no_update, no_update, no_update
+
+        try:
+            png_bytes = _EXPORT_EXECUTOR.submit(render_figure_png, figure).result()
+        except Exception as e:
+            # Kaleido >= 1 needs a Chrome/Chromium install on the server
+            logger.exception("Error exporting plot")
+            message = [
+                html.Strong("Export failed: "),
+                f"{e}. ",
+                "Use the camera icon in the plot toolbar to save a PNG "
+                "from the browser instead.",
+            ]
+            return no_update, message, True
+
+        return dcc.send_bytes(png_bytes, EXPORT_FILENAME), no_update, False
+
+
+def register_clientside_callbacks(app):
+    """
+    Register browser-side callbacks for pure view transforms.
+
+    Plot type toggles and the fullscreen button only restyle what is already
+    on the page, so they run in JavaScript (``assets/robomage.js``) instead of
+    making a server round-trip.
+    """
+    app.clientside_callback(
+        ClientsideFunction(namespace="robomage", function_name="updatePlotType"),
+        Output("main-plot", "figure", allow_duplicate=True),
+        Input("plot-type-selector", "value"),
+        State("main-plot", "figure"),
+        prevent_initial_call=True,
+    )
+
+    app.clientside_callback(
+        ClientsideFunction(namespace="robomage", function_name="toggleFullscreen"),
+        Output("fullscreen-btn", "title"),
+        Input("fullscreen-btn", "n_clicks"),
+        prevent_initial_call=True,
+    )
@@ -3,12 +3,80 @@ Main Dashboard Layout
 
 Phase 1.5: Professional tab-based layout for the RoboMage dashboard
 with Data Import, Visualization, and Analysis tabs.
+
+The layout is static, so each builder is memoized and returns the same
+component tree on every call. Dash only serializes these components, which
+makes sharing them between calls safe.
 """
 
+from __future__ import annotations
+
+import functools
+
 import dash_bootstrap_components as dbc
 from dash import dcc, html
 
+# Static control options, built once at import rather than on every layout build.
+# These lists are short, so their dropdowns are rendered without a search box.
+_WAVELENGTH_OPTIONS = (
+    {"label": "Synchrotron (0.1665 Å) - 74.5 keV", "value": 0.1665},
+    {"label": "Cu Kα (1.5406 Å) - 8.05 keV", "value": 1.5406},
+    {"label": "Mo Kα (0.7107 Å) - 17.44 keV", "value": 0.7107},
+    {"label": "Cr Kα (2.2897 Å) - 5.41 keV", "value": 2.2897},
+    {"label": "Custom...", "value": "custom"},
+)
+_X_AXIS_OPTIONS = (
+    {"label": "Q (Å⁻¹)", "value": "q"},
+    {"label": "2θ (degrees)", "value": "two_theta"},
+    {"label": "d-spacing (Å)", "value": "d_spacing"},
+)
+_Y_AXIS_OPTIONS = (
+    {"label": "Raw Intensity", "value": "raw"},
+    {"label": "Normalized", "value": "normalized"},
+    {"label": "Log Scale", "value": "log"},
+)
+_PLOT_TYPE_OPTIONS = (
+    {"label": "Line Plot", "value": "line"},
+    {"label": "Scatter Points", "value": "scatter"},
+    {"label": "Filled Area (Stacked)", "value": "area"},
+)
+_PROFILE_OPTIONS = (
+    {"label": "Gaussian", "value": "gaussian"},
+    {"label": "Lorentzian", "value": "lorentzian"},
+    {"label": "Voigt", "value": "voigt"},
+)
+_SENSITIVITY_MARKS = {i / 2: str(i / 2) for i in range(1, 5)}
+
+# Read-only icon leaves, shared by reference across the layout builders
+_ICON_CHART_LINE = html.I(className="fas fa-chart-line me-2")
+_ICON_FOLDER_OPEN = html.I(className="fas fa-folder-open me-2")
+_ICON_CLOUD_UPLOAD_ALT = html.I(className="fas fa-cloud-upload-alt fa-3x mb-3")
+_ICON_WAVE_SQUARE = html.I(className="fas fa-wave-square me-2")
+_ICON_INFO_CIRCLE = html.I(className="fas fa-info-circle me-2")
+_ICON_FILES = html.I(className="fas fa-files me-2")
+_ICON_CHART_AREA = html.I(className="fas fa-chart-area me-2")
+_ICON_EXPAND = html.I(className="fas fa-expand me-1")
+_ICON_DOWNLOAD = html.I(className="fas fa-download me-1")
+_ICON_SLIDERS_H = html.I(className="fas fa-sliders-h me-2")
+_ICON_MOUNTAIN = html.I(className="fas fa-mountain me-2")
+_ICON_PLAY = html.I(className="fas fa-play me-2")
+_ICON_CHART_BAR = html.I(className="fas fa-chart-bar me-2")
+_ICON_SERVER = html.I(className="fas fa-server me-2")
+_ICON_TIMES_CIRCLE = html.I(className="fas fa-times-circle me-1")
+_ICON_CIRCLE = html.I(className="fas fa-circle text-success me-1")
+
+
+def _row(children: list, className: str = "") -> html.Div:
+    """Bootstrap grid row as a plain Div (no dbc.Row wrapper component)."""
+    return html.Div(children, className=f"row {className}".rstrip())
+
+
+def _col(children: list, width: int, className: str = "") -> html.Div:
+    """Bootstrap grid column as a plain Div (no dbc.Col wrapper component)."""
+    return html.Div(children, className=f"col-{width} {className}".rstrip())
+
 
+@functools.lru_cache(maxsize=1)
 def create_main_layout() -> html.Div:
     """
     Create the main dashboard layout with tab-based interface.
@@ -51,20 +119,23 @@ def create_main_layout() -> html.Div:
             dcc.Store(id="file-data-store"),
             dcc.Store(id="wavelength-store"),
             dcc.Store(id="analysis-results-store"),
+            # Drives the clientside peak analysis service status check
+            dcc.Interval(id="service-poll", interval=30_000),
         ],
         fluid=True,
     )
 
 
-def create_header() -> dbc.Row:
+@functools.lru_cache(maxsize=1)
+def create_header() -> html.Div:
     """Create the dashboard header."""
-    return dbc.Row(
+    return _row(
         [
-            dbc.Col(
+            _col(
                 [
                     html.H1(
                         [
-                            html.I(className="fas fa-chart-line me-2"),
+                            _ICON_CHART_LINE,
                             "RoboMage Dashboard",
                         ],
                         className="text-primary",
@@ -76,7 +147,7 @@ def create_header() -> dbc.Row:
                 ],
                 width=8,
             ),
-            dbc.Col(
+            _col(
                 [
                     dbc.Badge("Sprint 4 - Phase 1.5", color="info", className="me-2"),
                     dbc.Badge("v0.1.0", color="secondary"),
@@ -88,16 +159,16 @@ def create_header() -> dbc.Row:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_import_tab() -> html.Div:
     """Create the Data Import tab content."""
-    _icon_class = "fas fa-cloud-upload-alt fa-3x mb-3"
     _text_class = "text-muted"
     return html.Div(
         [
-            dbc.Row(
+            _row(
                 [
                     # File upload section
-                    dbc.Col(
+                    _col(
                         [
                             dbc.Card(
                                 [
@@ -105,11 +176,7 @@ def create_import_tab() -> html.Div:
                                         [
                                             html.H5(
                                                 [
-                                                    html.I(
-                                                        className=(
-                                                            "fas fa-folder-open me-2"
-                                                        )
-                                                    ),
+                                                    _ICON_FOLDER_OPEN,
                                                     "File Upload",
                                                 ]
                                             )
@@ -121,7 +188,7 @@ def create_import_tab() -> html.Div:
                                                 id="upload-data",
                                                 children=html.Div(
                                                     [
-                                                        html.I(className=_icon_class),
+                                                        _ICON_CLOUD_UPLOAD_ALT,
                                                         html.Br(),
                                                         html.H5(
                                                             "Drag & Drop or "
@@ -138,16 +205,7 @@ def create_import_tab() -> html.Div:
                                                     ],
                                                     className="text-center p-4",
                                                 ),
-                                                style={
-                                                    "width": "100%",
-                                                    "height": "200px",
-                                                    "lineHeight": "40px",
-                                                    "borderWidth": "2px",
-                                                    "borderStyle": "dashed",
-                                                    "borderRadius": "10px",
-                                                    "borderColor": "#007bff",
-                                                    "backgroundColor": "#f8f9fa",
-                                                },
+                                                className="upload-dropzone",
                                                 multiple=True,
                                             ),
                                         ]
@@ -158,7 +216,7 @@ def create_import_tab() -> html.Div:
                         width=6,
                     ),
                     # Wavelength selection section
-                    dbc.Col(
+                    _col(
                         [
                             dbc.Card(
                                 [
@@ -166,11 +224,7 @@ def create_import_tab() -> html.Div:
                                         [
                                             html.H5(
                                                 [
-                                                    html.I(
-                                                        className=(
-                                                            "fas fa-wave-square me-2"
-                                                        ),
-                                                    ),
+                                                    _ICON_WAVE_SQUARE,
                                                     "Wavelength Settings",
                                                 ]
                                             )
@@ -184,40 +238,8 @@ def create_import_tab() -> html.Div:
                                             ),
                                             dcc.Dropdown(
                                                 id="wavelength-selector",
-                                                options=[
-                                                    {
-                                                        "label": (
-                                                            "Synchrotron (0.1665 Å) - "
-                                                            "74.5 keV"
-                                                        ),
-                                                        "value": 0.1665,
-                                                    },
-                                                    {
-                                                        "label": (
-                                                            "Cu Kα (1.5406 Å) - "
-                                                            "8.05 keV"
-                                                        ),
-                                                        "value": 1.5406,
-                                                    },
-                                                    {
-                                                        "label": (
-                                                            "Mo Kα (0.7107 Å) - "
-                                                            "17.44 keV"
-                                                        ),
-                                                        "value": 0.7107,
-                                                    },
-                                                    {
-                                                        "label": (
-                                                            "Cr Kα (2.2897 Å) - "
-                                                            "5.41 keV"
-                                                        ),
-                                                        "value": 2.2897,
-                                                    },
-                                                    {
-                                                        "label": "Custom...",
-                                                        "value": "custom",
-                                                    },
-                                                ],
+                                                options=_WAVELENGTH_OPTIONS,
+                                                searchable=False,
                                                 value=0.1665,
                                                 # Default to synchrotron as specified
                                                 clearable=False,
@@ -249,11 +271,7 @@ def create_import_tab() -> html.Div:
                                             # Current wavelength display
                                             dbc.Alert(
                                                 [
-                                                    html.I(
-                                                        className=(
-                                                            "fas fa-info-circle me-2"
-                                                        ),
-                                                    ),
+                                                    _ICON_INFO_CIRCLE,
                                                     html.Span(
                                                         "Current wavelength: ",
                                                         className="fw-bold",
@@ -277,9 +295,9 @@ def create_import_tab() -> html.Div:
             ),
             html.Br(),
             # Loaded files section
-            dbc.Row(
+            _row(
                 [
-                    dbc.Col(
+                    _col(
                         [
                             dbc.Card(
                                 [
@@ -287,9 +305,7 @@ def create_import_tab() -> html.Div:
                                         [
                                             html.H5(
                                                 [
-                                                    html.I(
-                                                        className="fas fa-files me-2"
-                                                    ),
+                                                    _ICON_FILES,
                                                     "Loaded Files",
                                                 ]
                                             )
@@ -315,7 +331,7 @@ def create_import_tab() -> html.Div:
                         ],
                         width=8,
                     ),
-                    dbc.Col(
+                    _col(
                         [
                             dbc.Card(
                                 [
@@ -323,11 +339,7 @@ def create_import_tab() -> html.Div:
                                         [
                                             html.H5(
                                                 [
-                                                    html.I(
-                                                        className=(
-                                                            "fas fa-info-circle me-2"
-                                                        ),
-                                                    ),
+                                                    _ICON_INFO_CIRCLE,
                                                     "File Information",
                                                 ]
                                             )
@@ -360,6 +372,7 @@ def create_import_tab() -> html.Div:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_visualization_tab() -> html.Div:
     """Create the Visualization tab content."""
     return html.Div(
@@ -371,7 +384,7 @@ def create_visualization_tab() -> html.Div:
                         [
                             html.H5(
                                 [
-                                    html.I(className="fas fa-chart-area me-2"),
+                                    _ICON_CHART_AREA,
                                     "Diffraction Pattern",
                                 ]
                             ),
@@ -379,7 +392,7 @@ def create_visualization_tab() -> html.Div:
                                 [
                                     dbc.Button(
                                         [
-                                            html.I(className="fas fa-expand me-1"),
+                                            _ICON_EXPAND,
                                             "Fullscreen",
                                         ],
                                         size="sm",
@@ -388,7 +401,7 @@ def create_visualization_tab() -> html.Div:
                                     ),
                                     dbc.Button(
                                         [
-                                            html.I(className="fas fa-download me-1"),
+                                            _ICON_DOWNLOAD,
                                             "Export",
                                         ],
                                         size="sm",
@@ -410,16 +423,26 @@ def create_visualization_tab() -> html.Div:
                                 config={
                                     "displayModeBar": True,
                                     "displaylogo": False,
-                                    "modeBarButtonsToRemove": ["lasso2d", "select2d"],
-                                    "toImageButtonOptions": {
-                                        "format": "png",
-                                        "filename": "diffraction_pattern",
-                                        "height": 600,
-                                        "width": 800,
-                                        "scale": 2,
-                                    },
+                                    "scrollZoom": True,
+                                    # Sharper WebGL traces on high-DPI screens
+                                    "plotGlPixelRatio": 2,
+                                    # The Export button renders PNGs on the
+                                    # server; the toolbar's toImage button
+                                    # stays as a browser-side fallback
+                                    "modeBarButtonsToRemove": [
+                                        "lasso2d",
+                                        "select2d",
+                                    ],
                                 },
-                                style={"height": "500px"},
+                                className="main-plot",
+                            ),
+                            dcc.Download(id="plot-download"),
+                            dbc.Alert(
+                                id="export-alert",
+                                color="warning",
+                                dismissable=True,
+                                is_open=False,
+                                className="mt-2 mb-0",
                             ),
                         ]
                     ),
@@ -433,7 +456,7 @@ def create_visualization_tab() -> html.Div:
                         [
                             html.H5(
                                 [
-                                    html.I(className="fas fa-sliders-h me-2"),
+                                    _ICON_SLIDERS_H,
                                     "Plot Controls",
                                 ]
                             )
@@ -441,78 +464,43 @@ def create_visualization_tab() -> html.Div:
                     ),
                     dbc.CardBody(
                         [
-                            dbc.Row(
+                            _row(
                                 [
-                                    dbc.Col(
+                                    _col(
                                         [
                                             html.Label("X-axis:", className="fw-bold"),
                                             dcc.Dropdown(
                                                 id="x-axis-selector",
-                                                options=[
-                                                    {"label": "Q (Å⁻¹)", "value": "q"},
-                                                    {
-                                                        "label": "2θ (degrees)",
-                                                        "value": "two_theta",
-                                                    },
-                                                    {
-                                                        "label": "d-spacing (Å)",
-                                                        "value": "d_spacing",
-                                                    },
-                                                ],
+                                                options=_X_AXIS_OPTIONS,
+                                                searchable=False,
                                                 value="q",
                                                 clearable=False,
                                             ),
                                         ],
                                         width=4,
                                     ),
-                                    dbc.Col(
+                                    _col(
                                         [
                                             html.Label("Y-axis:", className="fw-bold"),
                                             dcc.Dropdown(
                                                 id="y-axis-selector",
-                                                options=[
-                                                    {
-                                                        "label": "Raw Intensity",
-                                                        "value": "raw",
-                                                    },
-                                                    {
-                                                        "label": "Normalized",
-                                                        "value": "normalized",
-                                                    },
-                                                    {
-                                                        "label": "Log Scale",
-                                                        "value": "log",
-                                                    },
-                                                ],
+                                                options=_Y_AXIS_OPTIONS,
+                                                searchable=False,
                                                 value="raw",
                                                 clearable=False,
                                             ),
                                         ],
                                         width=4,
                                     ),
-                                    dbc.Col(
+                                    _col(
                                         [
                                             html.Label(
                                                 "Plot Type:", className="fw-bold"
                                             ),
                                             dcc.Dropdown(
                                                 id="plot-type-selector",
-                                                options=[
-                                                    {
-                                                        "label": "Line Plot",
-                                                        "value": "line",
-                                                    },
-                                                    {
-                                                        "label": "Scatter Points",
-                                                        "value": "scatter",
-                                                    },
-                                                    {
-                                                        "label": (
-                                                            "Filled Area (Stacked)"
-                                                        ),
-                                                        "value": "area",
-                                                    },
-                                                ],
+                                                options=_PLOT_TYPE_OPTIONS,
+                                                searchable=False,
                                                 value="line",
                                                 clearable=False,
                                             ),
@@ -523,9 +511,9 @@ def create_visualization_tab() -> html.Div:
                             ),
                             html.Hr(),
                             # Plot statistics
-                            dbc.Row(
+                            _row(
                                 [
-                                    dbc.Col(
+                                    _col(
                                         [
                                             html.H6(
                                                 "Plot Statistics", className="fw-bold"
@@ -553,142 +541,36 @@ def create_visualization_tab() -> html.Div:
     )
 
 
+@functools.lru_cache(maxsize=1)
 def create_analysis_tab() -> html.Div:
     """Create the Analysis tab content with peak analysis integration."""
     return html.Div(
         [
-            dbc.Row(
+            _row(
                 [
                     # Peak analysis controls
-                    dbc.Col(
+                    _col(
                         [
-                            dbc.Card(
-                                [
-                                    dbc.CardHeader(
-                                        [
-                                            html.H5(
-                                                [
-                                                    html.I(
-                                                        className="fas fa-mountain me-2"
-                                                    ),
-                                                    "Peak Analysis Controls",
-                                                ]
-                                            )
-                                        ]
-                                    ),
-                                    dbc.CardBody(
+                            # Controls are rendered once data is loaded
+                            # (see analysis.register_analysis_controls_callback)
+                            html.Div(
+                                id="analysis-controls-slot",
+                                children=[
+                                    dbc.Alert(
                                         [
-                                            # Analysis parameters
-                                            html.Div(
-                                                [
-                                                    html.Label(
-                                                        "Profile Type:",
-                                                        className="fw-bold",
-                                                    ),
-                                                    dcc.Dropdown(
-                                                        id="profile-selector",
-                                                        options=[
-                                                            {
-                                                                "label": "Gaussian",
-                                                                "value": "gaussian",
-                                                            },
-                                                            {
-                                                                "label": "Lorentzian",
-                                                                "value": "lorentzian",
-                                                            },
-                                                            {
-                                                                "label": "Voigt",
-                                                                "value": "voigt",
-                                                            },
-                                                        ],
-                                                        value="gaussian",
-                                                        clearable=False,
-                                                        className="mb-3",
-                                                    ),
-                                                    html.Label(
-                                                        "Minimum Prominence:",
-                                                        className="fw-bold",
-                                                    ),
-                                                    html.Small(
-                                                        (
-                                                            "Relative peak prominence "
-                                                            "(0-1)"
-                                                        ),
-                                                        className=(
-                                                            "text-muted d-block mb-1"
-                                                        ),
-                                                    ),
-                                                    dcc.Input(
-                                                        id="min-prominence-input",
-                                                        type="number",
-                                                        min=0.001,
-                                                        max=1.0,
-                                                        step=0.01,
-                                                        value=0.01,
-                                                        className="form-control mb-3",
-                                                    ),
-                                                    html.Label(
-                                                        "Minimum Distance (Å⁻¹):",
-                                                        className="fw-bold",
-                                                    ),
-                                                    html.Small(
-                                                        "Minimum Q-space between peaks",
-                                                        className=(
-                                                            "text-muted d-block mb-1"
-                                                        ),
-                                                    ),
-                                                    dcc.Input(
-                                                        id="min-distance-input",
-                                                        type="number",
-                                                        min=0.01,
-                                                        max=5.0,
-                                                        step=0.01,
-                                                        value=0.1,
-                                                        className="form-control mb-3",
-                                                    ),
-                                                    html.Label(
-                                                        "Detection Sensitivity:",
-                                                        className="fw-bold",
-                                                    ),
-                                                    dcc.Slider(
-                                                        id="sensitivity-slider",
-                                                        min=0.1,
-                                                        max=2.0,
-                                                        step=0.1,
-                                                        value=1.0,
-                                                        marks={
-                                                            0.5: "0.5",
-                                                            1.0: "1.0",
-                                                            1.5: "1.5",
-                                                            2.0: "2.0",
-                                                        },
-                                                        className="mb-4",
-                                                    ),
-                                                    dbc.Button(
-                                                        [
-                                                            html.I(
-                                                                className=(
-                                                                    "fas fa-play me-2"
-                                                                )
-                                                            ),
-                                                            "Run Analysis",
-                                                        ],
-                                                        id="run-analysis-btn",
-                                                        color="primary",
-                                                        size="lg",
-                                                        className="w-100",
-                                                    ),
-                                                ]
-                                            ),
-                                        ]
-                                    ),
-                                ]
+                                            _ICON_INFO_CIRCLE,
+                                            "Load data in the Data Import tab "
+                                            "to configure peak analysis.",
+                                        ],
+                                        color="light",
+                                    )
+                                ],
                             )
                         ],
                         width=6,
                     ),
                     # Results area
-                    dbc.Col(
+                    _col(
                         [
                             dbc.Card(
                                 [
@@ -696,11 +578,7 @@ def create_analysis_tab() -> html.Div:
                                         [
                                             html.H5(
                                                 [
-                                                    html.I(
-                                                        className=(
-                                                            "fas fa-chart-bar me-2"
-                                                        )
-                                                    ),
+                                                    _ICON_CHART_BAR,
                                                     "Analysis Results",
                                                 ]
                                             )
@@ -708,40 +586,48 @@ def create_analysis_tab() -> html.Div:
                                     ),
                                     dbc.CardBody(
                                         [
-                                            html.Div(
-                                                id="analysis-summary",
-                                                children=[
-                                                    dbc.Alert(
-                                                        [
-                                                            html.I(
-                                                                className=(
-                                                                    "fas "
-                                                                    "fa-info-circle "
-                                                                    "me-2"
-                                                                )
-                                                            ),
-                                                            (
-                                                                "Click 'Run Analysis'"
-                                                                " to detect peaks in"
-                                                                " your data."
-                                                            ),
-                                                            html.Br(),
-                                                            html.Small(
-                                                                "Make sure files are "
-                                                                "loaded in the Data "
-                                                                "Import tab.",
-                                                                className="text-muted",
-                                                            ),
-                                                        ],
-                                                        color="info",
-                                                    )
-                                                ],
-                                            )
+                                            # Shown only while analysis runs
+                                            dbc.Progress(
+                                                id="analysis-progress",
+                                                value=0,
+                                                striped=True,
+                                                animated=True,
+                                                className="mb-3",
+                                                style={"visibility": "hidden"},
+                                            ),
+                                            dbc.Spinner(
+                                                html.Div(
+                                                    id="analysis-summary",
+                                                    children=[
+                                                        dbc.Alert(
+                                                            [
+                                                                _ICON_INFO_CIRCLE,
+                                                                (
+                                                                    "Click 'Run "
+                                                                    "Analysis' to "
+                                                                    "detect peaks "
+                                                                    "in your data."
+                                                                ),
+                                                                html.Br(),
+                                                                html.Small(
+                                                                    "Make sure "
+                                                                    "files are "
+                                                                    "loaded in the "
+                                                                    "Data Import "
+                                                                    "tab.",
+                                                                    className=(
+                                                                        "text-muted"
+                                                                    ),
+                                                                ),
+                                                            ],
+                                                            color="info",
+                                                        )
+                                                    ],
+                                                ),
+                                                color="primary",
+                                            ),
                                         ],
-                                        style={
-                                            "maxHeight": "500px",
-                                            "overflowY": "auto",
-                                        },
+                                        className="analysis-results-body",
                                     ),
                                 ]
                             )
@@ -758,7 +644,7 @@ def create_analysis_tab() -> html.Div:
                         [
                             html.H5(
                                 [
-                                    html.I(className="fas fa-server me-2"),
+                                    _ICON_SERVER,
                                     "Service Status",
                                 ]
                             )
@@ -766,21 +652,17 @@ def create_analysis_tab() -> html.Div:
                     ),
                     dbc.CardBody(
                         [
-                            dbc.Row(
+                            _row(
                                 [
-                                    dbc.Col(
+                                    _col(
                                         [
                                             html.P(
                                                 "Peak Analysis Service:",
-                                                className=("fw-bold mb-1"),
+                                                className="fw-bold mb-1",
                                             ),
                                             dbc.Badge(
                                                 [
-                                                    html.I(
-                                                        className=(
-                                                            "fas fa-times-circle me-1"
-                                                        )
-                                                    ),
+                                                    _ICON_TIMES_CIRCLE,
                                                     "Not Connected",
                                                 ],
                                                 color="warning",
@@ -789,7 +671,7 @@ def create_analysis_tab() -> html.Div:
                                         ],
                                         width=8,
                                     ),
-                                    dbc.Col(
+                                    _col(
                                         [
                                             html.Small(
                                                 [
@@ -817,15 +699,113 @@ def create_analysis_tab() -> html.Div:
     )
 
 
-def create_status_bar() -> dbc.Row:
+@functools.lru_cache(maxsize=1)
+def create_analysis_controls() -> dbc.Card:
+    """Create the peak analysis controls card (rendered once data is loaded)."""
+    return dbc.Card(
+        [
+            dbc.CardHeader(
+                [
+                    html.H5(
+                        [
+                            _ICON_MOUNTAIN,
+                            "Peak Analysis Controls",
+                        ]
+                    )
+                ]
+            ),
+            dbc.CardBody(
+                [
+                    # Analysis parameters
+                    html.Div(
+                        [
+                            html.Label(
+                                "Profile Type:",
+                                className="fw-bold",
+                            ),
+                            dcc.Dropdown(
+                                id="profile-selector",
+                                options=_PROFILE_OPTIONS,
+                                searchable=False,
+                                value="gaussian",
+                                clearable=False,
+                                className="mb-3",
+                            ),
+                            html.Label(
+                                "Minimum Prominence:",
+                                className="fw-bold",
+                            ),
+                            html.Small(
+                                "Relative peak prominence (0-1)",
+                                className="text-muted d-block mb-1",
+                            ),
+                            dcc.Input(
+                                id="min-prominence-input",
+                                type="number",
+                                min=0.001,
+                                max=1.0,
+                                step=0.01,
+                                value=0.01,
+                                className="form-control mb-3",
+                            ),
+                            html.Label(
+                                "Minimum Distance (Å⁻¹):",
+                                className="fw-bold",
+                            ),
+                            html.Small(
+                                "Minimum Q-space between peaks",
+                                className="text-muted d-block mb-1",
+                            ),
+                            dcc.Input(
+                                id="min-distance-input",
+                                type="number",
+                                min=0.01,
+                                max=5.0,
+                                step=0.01,
+                                value=0.1,
+                                className="form-control mb-3",
+                            ),
+                            html.Label(
+                                "Detection Sensitivity:",
+                                className="fw-bold",
+                            ),
+                            dcc.Slider(
+                                id="sensitivity-slider",
+                                min=0.1,
+                                max=2.0,
+                                step=0.1,
+                                value=1.0,
+                                marks=_SENSITIVITY_MARKS,
+                                className="mb-4",
+                            ),
+                            dbc.Button(
+                                [
+                                    _ICON_PLAY,
+                                    "Run Analysis",
+                                ],
+                                id="run-analysis-btn",
+                                color="primary",
+                                size="lg",
+                                className="w-100",
+                            ),
+                        ]
+                    ),
+                ]
+            ),
+        ]
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def create_status_bar() -> html.Div:
     """Create the status bar."""
-    return dbc.Row(
+    return _row(
         [
-            dbc.Col(
+            _col(
                 [
                     html.Small(
                         [
-                            html.I(className="fas fa-circle text-success me-1"),
+                            _ICON_CIRCLE,
                             html.Span("Dashboard Ready", id="status-text"),
                         ],
                         className="text-muted",
@@ -833,7 +813,7 @@ def create_status_bar() -> dbc.Row:
                 ],
                 width=6,
             ),
-            dbc.Col(
+            _col(
                 [
                     html.Small(
                         [
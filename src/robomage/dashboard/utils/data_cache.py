@@ -0,0 +1,116 @@
+"""
+Server-side Data Cache
+
+Keeps uploaded diffraction arrays on the server so dcc.Store only carries
+small metadata and a cache key. Backed by diskcache so background callback
+worker processes see the same data as the web server.
+"""
+
+import os
+import uuid
+from pathlib import Path
+from typing import Any
+
+import diskcache
+import numpy as np
+
+from robomage._paths import user_cache_dir
+
+# Uploaded arrays expire after a day of inactivity
+DATA_CACHE_EXPIRE = 24 * 60 * 60
+
+# Opened on first use (or by configure_data_cache from create_app), so
+# importing the callbacks never touches the filesystem
+_data_cache: diskcache.Cache | None = None
+_data_cache_dir: Path | None = None
+
+
+def configure_data_cache(directory: str | os.PathLike[str] | None = None) -> Path:
+    """
+    Set the directory backing the server-side data cache.
+
+    Args:
+        directory: Cache directory. Defaults to ``dashboard-data`` in the
+            per-user RoboMage cache directory (see ``ROBOMAGE_CACHE_DIR``)
+
+    Returns:
+        The cache directory in use
+    """
+    global _data_cache, _data_cache_dir
+
+    if _data_cache is not None:
+        _data_cache.close()
+        _data_cache = None
+    _data_cache_dir = (
+        Path(directory) if directory is not None else user_cache_dir("dashboard-data")
+    )
+    return _data_cache_dir
+
+
+def _get_data_cache() -> diskcache.Cache:
+    """Return the data cache, opening it on first use."""
+    global _data_cache
+
+    if _data_cache is None:
+        directory = _data_cache_dir or configure_data_cache()
+        _data_cache = diskcache.Cache(str(directory))
+    return _data_cache
+
+
+def cache_file_data(file_data: dict[str, Any]) -> dict[str, Any]:
+    """
+    Move the Q/intensity arrays of parsed file data into the server cache.
+
+    Args:
+        file_data: Parsed file data with ``q`` and ``intensity`` lists
+
+    Returns:
+        Store entry with the arrays replaced by a ``data_key``
+    """
+    data_key = uuid.uuid4().hex
+    arrays = (
+        np.asarray(file_data["q"], dtype=float),
+        np.asarray(file_data["intensity"], dtype=float),
+    )
+    _get_data_cache().set(data_key, arrays, expire=DATA_CACHE_EXPIRE)
+
+    entry = {k: v for k, v in file_data.items() if k not in ("q", "intensity")}
+    entry["data_key"] = data_key
+    return entry
+
+
+def hydrate_file_data(entry: dict[str, Any]) -> dict[str, Any] | None:
+    """
+    Restore the Q/intensity arrays for a store entry.
+
+    Args:
+        entry: Store entry produced by :func:`cache_file_data`
+
+    Returns:
+        Entry with ``q`` and ``intensity`` arrays, or None if the cached
+        arrays have expired
+    """
+    if "data_key" not in entry:
+        # Entry still carries its arrays inline
+        return entry
+
+    data_cache = _get_data_cache()
+    arrays = data_cache.get(entry["data_key"])
+    if arrays is None:
+        return None
+
+    # Reading refreshes the expiry so data in active use is kept
+    data_cache.touch(entry["data_key"], expire=DATA_CACHE_EXPIRE)
+    q_values, intensities = arrays
+    return {**entry, "q": q_values, "intensity": intensities}
+
+
+def evict_file_data(entry: dict[str, Any]) -> None:
+    """
+    Drop the cached arrays for a removed store entry.
+
+    Args:
+        entry: Store entry produced by :func:`cache_file_data`
+    """
+    if "data_key" in entry:
+        _get_data_cache().delete(entry["data_key"])
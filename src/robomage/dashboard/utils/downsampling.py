@@ -0,0 +1,115 @@
+"""
+Plot Downsampling
+
+Viewport-aware min-max downsampling for large diffraction patterns.
+Keeps the number of points sent to the browser bounded by the plot width
+while preserving peak maxima and minima within each bucket.
+"""
+
+from typing import Any
+
+import numpy as np
+
+# Roughly two points per horizontal pixel of the main plot
+MAX_PLOT_POINTS = 4000
+
+
+def get_viewport_range(relayout_data: dict[str, Any] | None) -> tuple | None:
+    """
+    Extract the x-axis range from a Plotly ``relayoutData`` event.
+
+    Args:
+        relayout_data: relayoutData from a dcc.Graph
+
+    Returns:
+        Tuple of (x_min, x_max), or None for autorange / no x-axis change
+    """
+    if not relayout_data or relayout_data.get("xaxis.autorange"):
+        return None
+
+    if "xaxis.range[0]" in relayout_data and "xaxis.range[1]" in relayout_data:
+        bounds = relayout_data["xaxis.range[0]"], relayout_data["xaxis.range[1]"]
+    elif "xaxis.range" in relayout_data:
+        bounds = tuple(relayout_data["xaxis.range"])
+    else:
+        return None
+
+    return min(bounds), max(bounds)
+
+
+def minmax_downsample(y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select indices keeping the minimum and maximum of each bucket.
+
+    Args:
+        y: Signal values
+        n_out: Maximum number of indices to return
+
+    Returns:
+        Sorted index array of at most ``n_out`` entries
+    """
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+
+    # Reserve the first and last point so the trace spans the full range
+    n_bins = max((n_out - 2) // 2, 1)
+    bin_size = (n - 2) // n_bins
+    stop = 1 + n_bins * bin_size
+    buckets = y[1:stop].reshape(n_bins, bin_size)
+
+    offsets = 1 + np.arange(n_bins) * bin_size
+    lows = offsets + np.argmin(buckets, axis=1)
+    highs = offsets + np.argmax(buckets, axis=1)
+
+    # The last bucket also takes the remainder that doesn't fill a whole bin,
+    # so no points before the final one are skipped
+    if stop < n - 1:
+        tail = y[offsets[-1] : n - 1]
+        lows[-1] = offsets[-1] + np.argmin(tail)
+        highs[-1] = offsets[-1] + np.argmax(tail)
+
+    indices = np.concatenate(([0], lows, highs, [n - 1]))
+    return np.unique(indices)
+
+
+def downsample_trace(
+    x_data: list[float],
+    y_data: list[float],
+    x_range: tuple | None = None,
+    n_out: int = MAX_PLOT_POINTS,
+) -> tuple[list[float], list[float]]:
+    """
+    Reduce a trace to the points needed to draw the current viewport.
+
+    Args:
+        x_data: X values in display units (may be descending, e.g. d-spacing)
+        y_data: Y values
+        x_range: Visible (x_min, x_max), or None for the full trace. Only
+            applied to traces longer than ``n_out``
+        n_out: Maximum number of points to keep
+
+    Returns:
+        Tuple of (x_data, y_data) lists
+    """
+    x = np.asarray(x_data, dtype=float)
+    y = np.asarray(y_data, dtype=float)
+
+    # Traces within the limit are sent whole, so zooming out or switching
+    # axes never leaves them cut to an earlier viewport
+    if len(x) <= n_out:
+        return x.tolist(), y.tolist()
+
+    if x_range is not None:
+        visible = np.flatnonzero((x >= x_range[0]) & (x <= x_range[1]))
+        if len(visible):
+            # Include one neighbour on each side so lines reach the plot edges
+            start = max(visible[0] - 1, 0)
+            stop = min(visible[-1] + 2, len(x))
+            x, y = x[start:stop], y[start:stop]
+
+    if len(x) <= n_out:
+        return x.tolist(), y.tolist()
+
+    indices = minmax_downsample(y, n_out)
+    return x[indices].tolist(), y[indices].tolist()
@@ -17,6 +17,7 @@ Key Components:
     - load_diffraction_file(): Smart file loader with format auto-detection
     - load_chi_file(): Specialized loader for .chi format files
     - load_xy_file(): Specialized loader for .xy format files
+    - load_many(): Load several files concurrently
 
 Design Philosophy:
     - **Validation First**: All data is validated upon loading using Pydantic
@@ -73,11 +74,17 @@ See Also:
 # Import core data structures from models
 # Import file loading utilities from loaders
 # Also import the test data loader for convenience
-from .loaders import load_chi_file, load_diffraction_file, load_test_data, load_xy_file
+from .loaders import (
+    load_chi_file,
+    load_diffraction_file,
+    load_many,
+    load_test_data,
+    load_xy_file,
+)
 from .models import DataStatistics, DiffractionData
 
 # Public API - these are the recommended imports for users
-__all__ = [
+__all__ = (
     # Core data structures (most important)
     "DiffractionData",  # Main data container with validation
     "DataStatistics",  # Statistical properties and quality metrics
@@ -85,5 +92,6 @@ __all__ = [
     "load_diffraction_file",  # Smart loader with format auto-detection
     "load_chi_file",  # Specialized .chi file loader
     "load_xy_file",  # Specialized .xy file loader
+    "load_many",  # Concurrent multi-file loader
     "load_test_data",  # Built-in SRM 660b test dataset
-]
+)
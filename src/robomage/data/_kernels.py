@@ -0,0 +1,172 @@
+"""
+Numeric kernels for the data models.
+
+Hot loops used by DiffractionData validation and statistics. When numba is
+installed the loop kernels are JIT-compiled (and cached on disk); otherwise
+the public functions fall back to NumPy implementations with the same results.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+
+# Block size for the NumPy fallback; keeps the comparison temporaries small
+# and lets sorted checks stop at the first out-of-order block
+_CHUNK = 65536
+
+
+def _is_sorted_loop(q):  # type: ignore[no-untyped-def]
+    for i in range(q.size - 1):
+        # Written as "not <=" so NaNs count as out of order, like NumPy
+        if not q[i] <= q[i + 1]:
+            return False
+    return True
+
+
+def _pattern_stats_loop(q, intensities):  # type: ignore[no-untyped-def]
+    n = q.size
+    q_min = q_max = q[0]
+    i_min = i_max = intensities[0]
+    # Welford running moments; avoids the cancellation of sum/sumsq
+    i_mean = 0.0
+    i_m2 = 0.0
+    step_mean = 0.0
+    step_m2 = 0.0
+    for i in range(n):
+        qi = q[i]
+        yi = intensities[i]
+        # min()/max() would skip NaNs; the extra test propagates them like
+        # the NumPy reductions (once NaN, comparisons keep it)
+        if qi < q_min or qi != qi:
+            q_min = qi
+        if qi > q_max or qi != qi:
+            q_max = qi
+        if yi < i_min or yi != yi:
+            i_min = yi
+        if yi > i_max or yi != yi:
+            i_max = yi
+        delta = yi - i_mean
+        i_mean += delta / (i + 1)
+        i_m2 += delta * (yi - i_mean)
+        if i > 0:
+            step = qi - q[i - 1]
+            delta = step - step_mean
+            step_mean += delta / i
+            step_m2 += delta * (step - step_mean)
+    if n > 1:
+        step_std = np.sqrt(step_m2 / (n - 1))
+    else:
+        step_mean = step_std = np.nan
+    return (
+        q_min,
+        q_max,
+        i_min,
+        i_max,
+        i_mean,
+        np.sqrt(i_m2 / n),
+        step_mean,
+        step_std,
+    )
+
+
+if njit is not None:
+    _is_sorted_jit = njit(cache=True)(_is_sorted_loop)
+    _pattern_stats_jit = njit(cache=True)(_pattern_stats_loop)
+
+
+def _use_jit(*arrays: np.ndarray) -> bool:
+    return njit is not None and all(
+        a.ndim == 1 and a.dtype == np.float64 for a in arrays
+    )
+
+
+def is_sorted(q: np.ndarray) -> bool:
+    """
+    Check whether a 1-D array is in non-decreasing order.
+
+    Stops at the first out-of-order element instead of materialising a
+    full boolean comparison array.
+
+    Args:
+        q: Array to check
+
+    Returns:
+        True if ``q[i] <= q[i + 1]`` for every element
+    """
+    if _use_jit(q):
+        return bool(_is_sorted_jit(q))
+
+    q = np.ravel(q)
+    for start in range(0, q.size - 1, _CHUNK):
+        block = q[start : start + _CHUNK + 1]
+        if not np.all(block[:-1] <= block[1:]):
+            return False
+    return True
+
+
+def pattern_stats(
+    q: np.ndarray, intensities: np.ndarray
+) -> tuple[float, float, float, float, float, float, float, float]:
+    """
+    Compute the summary statistics of a diffraction pattern.
+
+    With numba this is a single fused pass over both arrays; the fallback
+    uses NumPy reductions with one temporary per array. Sums are accumulated
+    in float64 whatever the input dtype. Standard deviations are population
+    (``ddof=0``) values, matching ``np.std``.
+
+    Args:
+        q: Q values
+        intensities: Intensity values of the same length
+
+    Returns:
+        Tuple of (q_min, q_max, intensity_min, intensity_max, intensity_mean,
+        intensity_std, q_step_mean, q_step_std). The Q step values are NaN
+        for a single-point pattern.
+    """
+    if _use_jit(q, intensities):
+        q_min, q_max, i_min, i_max, i_mean, i_std, step_mean, step_std = (
+            _pattern_stats_jit(q, intensities)
+        )
+        return (
+            float(q_min),
+            float(q_max),
+            float(i_min),
+            float(i_max),
+            float(i_mean),
+            float(i_std),
+            float(step_mean),
+            float(step_std),
+        )
+
+    # One temporary per array: deviations are formed in place and squared
+    # and summed by np.dot, instead of np.diff plus np.std's own temporaries
+    n = q.size
+    if n > 1:
+        # Averaged from the steps rather than the end points, so a NaN
+        # inside Q propagates to the mean as it does to the std
+        deviations = np.subtract(q[1:], q[:-1], dtype=np.float64)
+        step_mean = float(deviations.mean())
+        deviations -= step_mean
+        step_std = float(np.sqrt(np.dot(deviations, deviations) / (n - 1)))
+    else:
+        step_mean = step_std = np.nan
+
+    # Accumulate in float64 even for float32 input
+    intensity_mean = float(intensities.mean(dtype=np.float64))
+    deviations = np.subtract(intensities, intensity_mean, dtype=np.float64)
+    intensity_std = float(np.sqrt(np.dot(deviations, deviations) / n))
+
+    return (
+        float(q.min()),
+        float(q.max()),
+        float(intensities.min()),
+        float(intensities.max()),
+        intensity_mean,
+        intensity_std,
+        step_mean,
+        step_std,
+    )
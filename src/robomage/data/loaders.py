@@ -37,12 +37,33 @@ See Also:
     - models.py: Core data structures and validation
 """
 
+import functools
+import hashlib
+import os
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import numpy as np
 
+from .._paths import user_cache_dir
 from .models import DiffractionData
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def _split_columns(data: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Split (N, 2) data into Q and intensity views of one column-major buffer.
+
+    Both views are contiguous, so scans over Q or intensity alone (sorting,
+    statistics, trimming) stream through memory instead of striding past
+    the other column. Column-major input (e.g. from pandas) is not copied.
+    """
+    data = np.asfortranarray(data, dtype=np.float64)
+    return data[:, 0], data[:, 1]
+
 
 def load_chi_file(filepath: str | Path) -> DiffractionData:
     """Load a .chi file containing Q and intensity data.
@@ -84,7 +105,8 @@ def load_chi_file(filepath: str | Path) -> DiffractionData:
         >>> # 1.1  150.2
         >>> # 1.2  120.8
     """
-    filepath = Path(filepath)
+    if not isinstance(filepath, Path):
+        filepath = Path(filepath)
 
     if not filepath.suffix.lower() == ".chi":
         raise ValueError(f"Expected .chi file, got: {filepath.suffix}")
@@ -93,19 +115,27 @@ def load_chi_file(filepath: str | Path) -> DiffractionData:
         raise FileNotFoundError(f"File not found: {filepath}")
 
     try:
-        # Read the file, skipping comment lines that start with #
-        data = np.loadtxt(filepath, comments="#")
-
-        if data.shape[1] != 2:
-            raise ValueError(f"Expected 2 columns, got {data.shape[1]}")
+        # Reuse arrays parsed from the same unchanged file; fall back to a
+        # direct parse if the file cannot be stat'ed
+        try:
+            stat = filepath.stat()
+        except OSError:
+            q_values, intensities = _parse_chi(filepath)
+        else:
+            q_values, intensities = _parse_chi_cached(
+                str(filepath.resolve()), stat.st_mtime_ns, stat.st_size
+            )
+            # The cached arrays are shared, so each caller gets its own
+            # writable copy (one column-major block, like a fresh parse)
+            q_values, intensities = _split_columns(np.stack((q_values, intensities)).T)
 
         # Extract filename for metadata
         filename = filepath.name
 
         # Create DiffractionData with metadata
         return DiffractionData(
-            q_values=data[:, 0],
-            intensities=data[:, 1],
+            q_values=q_values,
+            intensities=intensities,
             filename=filename,
         )
 
@@ -113,6 +143,66 @@ def load_chi_file(filepath: str | Path) -> DiffractionData:
         raise ValueError(f"Failed to parse {filepath}: {e}") from e
 
 
+# Spellings of NaN accepted in data files, as np.loadtxt did. pandas' wider
+# default NA set ("NA", "null", ...) is not wanted for numeric columns
+_NAN_VALUES = ["nan", "NaN", "NAN", "-nan", "+nan"]
+
+
+def read_table_df(filepath: str | Path) -> "pd.DataFrame":
+    """Read a whitespace-separated numeric text file into a float64 DataFrame.
+
+    Uses pandas' C tokenizer, skipping '#' comment lines. Only the usual
+    spellings of NaN are treated as missing. The file is memory-mapped
+    rather than read through a buffered stream, so repeat loads of a file
+    in the page cache avoid an extra kernel copy. Columns are left unnamed;
+    callers check the column count before naming them.
+    """
+    # pandas is imported lazily; only the file readers need it
+    import pandas as pd
+
+    return pd.read_csv(
+        filepath,
+        sep=r"\s+",
+        comment="#",
+        header=None,
+        dtype=np.float64,
+        engine="c",
+        keep_default_na=False,
+        na_values=_NAN_VALUES,
+        memory_map=True,
+    )
+
+
+def _read_table(filepath: str | Path) -> np.ndarray:
+    """Read a whitespace-separated numeric text file into a float64 array."""
+    return read_table_df(filepath).to_numpy()
+
+
+def _parse_chi(filepath: str | Path) -> tuple[np.ndarray, np.ndarray]:
+    """Parse the Q and intensity columns of a .chi file."""
+    data = _read_table(filepath)
+
+    if data.shape[1] != 2:
+        raise ValueError(f"Expected 2 columns, got {data.shape[1]}")
+
+    return _split_columns(data)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_chi_cached(
+    path: str, mtime_ns: int, size: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Parse a .chi file, memoized on its resolved path, mtime and size.
+
+    Editing the file changes the key, so stale entries are never returned.
+    The cached arrays are read-only; load_chi_file copies them for callers.
+    """
+    q_values, intensities = _parse_chi(path)
+    q_values.flags.writeable = False
+    intensities.flags.writeable = False
+    return q_values, intensities
+
+
 def load_xy_file(filepath: str | Path) -> DiffractionData:
     """Load a .xy file containing Q and intensity data.
 
@@ -145,17 +235,17 @@ def load_xy_file(filepath: str | Path) -> DiffractionData:
         - Skips comment lines starting with '#'
         - Validates data for NaN/infinity values
     """
-    filepath = Path(filepath)
+    if not isinstance(filepath, Path):
+        filepath = Path(filepath)
 
     if not filepath.exists():
         raise FileNotFoundError(f"File not found: {filepath}")
 
     try:
-        # Load the data using numpy, handling various delimiters
-        # Skip comment lines and handle both tab and space separation
-        data = np.loadtxt(filepath, delimiter=None, comments="#")
+        # Handles both tab and space separation and skips comment lines
+        data = _read_table(filepath)
 
-        if data.ndim != 2 or data.shape[1] != 2:
+        if data.shape[1] != 2:
             raise ValueError(
                 f"Expected 2-column data, got shape {data.shape}. "
                 "XY files should contain Q and intensity columns."
@@ -169,9 +259,10 @@ def load_xy_file(filepath: str | Path) -> DiffractionData:
         filename = filepath.name
 
         # Create DiffractionData with metadata
+        q_values, intensities = _split_columns(data)
         return DiffractionData(
-            q_values=data[:, 0],
-            intensities=data[:, 1],
+            q_values=q_values,
+            intensities=intensities,
             filename=filename,
         )
 
@@ -219,11 +310,13 @@ def load_diffraction_file(filepath: str | Path) -> DiffractionData:
         ... except ValueError as e:
         ...     print(f"Format error: {e}")
     """
-    filepath = Path(filepath)
+    if not isinstance(filepath, Path):
+        filepath = Path(filepath)
 
-    if filepath.suffix.lower() == ".chi":
+    suffix = filepath.suffix.lower()
+    if suffix == ".chi":
         return load_chi_file(filepath)
-    elif filepath.suffix.lower() == ".xy":
+    elif suffix == ".xy":
         return load_xy_file(filepath)
     else:
         raise ValueError(
@@ -231,6 +324,38 @@ def load_diffraction_file(filepath: str | Path) -> DiffractionData:
         )
 
 
+def load_many(
+    filepaths: Iterable[str | Path], max_workers: int | None = None
+) -> list[DiffractionData]:
+    """Load several diffraction data files concurrently.
+
+    Each file is loaded with :func:`load_diffraction_file` on a thread pool.
+    File reads and pandas' C parser release the GIL, so disk latency and
+    parsing of different files overlap.
+
+    Args:
+        filepaths: Paths to the files to load (any supported format).
+        max_workers: Maximum number of worker threads. Defaults to the
+            ThreadPoolExecutor default.
+
+    Returns:
+        list[DiffractionData]: Loaded data in the same order as ``filepaths``.
+
+    Raises:
+        ValueError: If a file format is not supported or a file cannot be
+            parsed.
+        FileNotFoundError: If a file doesn't exist.
+
+    Example:
+        >>> from pathlib import Path
+        >>> from robomage.data.loaders import load_many
+        >>> patterns = load_many(sorted(Path("run_042").glob("*.chi")))
+        >>> print(f"Loaded {len(patterns)} patterns")
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(load_diffraction_file, filepaths))
+
+
 def load_test_data() -> DiffractionData:
     """Load the standard test dataset (SRM 660b LaB₆).
 
@@ -252,6 +377,9 @@ def load_test_data() -> DiffractionData:
         - This is a real experimental dataset from NIST
         - Useful for testing algorithms and demonstrating functionality
         - The file is automatically located relative to the package structure
+        - Parsed arrays are cached as a .npy file in the user cache
+          directory (``$ROBOMAGE_CACHE_DIR``, or e.g. ``~/.cache/robomage``)
+          so later calls skip text parsing
 
     Example:
         >>> from robomage.data.loaders import load_test_data
@@ -278,4 +406,56 @@ def load_test_data() -> DiffractionData:
     if not test_file.exists():
         raise FileNotFoundError(f"Test data file not found: {test_file}")
 
-    return load_chi_file(test_file)
+    # Reuse the parsed arrays from a .npy cache in the user cache directory
+    # when it is at least as new as the source. The name is keyed on the
+    # source path so separate installs don't share an entry
+    source_key = hashlib.sha1(str(test_file.resolve()).encode()).hexdigest()[:12]
+    cache_file = user_cache_dir() / f"{test_file.stem}-{source_key}.npy"
+    cached = _read_array_cache(test_file, cache_file)
+    if cached is not None:
+        return DiffractionData._unchecked(
+            q_values=cached[:, 0],
+            intensities=cached[:, 1],
+            filename=test_file.name,
+        )
+
+    data = load_chi_file(test_file)
+    _write_array_cache(cache_file, data)
+    return data
+
+
+def _read_array_cache(source: Path, cache_file: Path) -> np.ndarray | None:
+    """Load a cached (N, 2) Q/intensity array if it is still valid.
+
+    The array is read into memory (not memory-mapped), so callers get
+    ordinary writable arrays, as from a fresh parse.
+    """
+    try:
+        if cache_file.stat().st_mtime_ns < source.stat().st_mtime_ns:
+            return None
+        cached: np.ndarray = np.load(cache_file)
+    except (OSError, ValueError):
+        return None
+
+    if cached.ndim != 2 or cached.shape[1] != 2 or cached.shape[0] == 0:
+        return None
+    return cached
+
+
+def _write_array_cache(cache_file: Path, data: DiffractionData) -> None:
+    """Save sorted Q/intensity arrays as a column-major (N, 2) .npy file."""
+    buffer = np.empty((len(data.q_values), 2), dtype=np.float64, order="F")
+    buffer[:, 0] = data.q_values
+    buffer[:, 1] = data.intensities
+
+    # Write to a private temporary name and rename, so concurrent readers
+    # never see a partial file
+    tmp_file = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_file, "wb") as fh:
+            np.save(fh, buffer)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        # Unwritable cache directory; keep parsing the .chi file
+        tmp_file.unlink(missing_ok=True)
@@ -39,15 +39,26 @@ Design Philosophy:
     - Domain semantics: Methods and properties that match powder diffraction workflows
 """
 
+from contextvars import ContextVar
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
-import pandas as pd
-from pydantic import BaseModel, ConfigDict, Field, computed_field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, computed_field
 
+from ._kernels import is_sorted, pattern_stats
 
-class DataStatistics(BaseModel):
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Set while DiffractionData._unchecked builds an instance from arrays that are
+# already known to be sorted by Q
+_Q_PRESORTED: ContextVar[bool] = ContextVar("_Q_PRESORTED", default=False)
+
+
+@dataclass(frozen=True, slots=True)
+class DataStatistics:
     """
     Statistical summary and quality metrics for powder diffraction data.
 
@@ -72,6 +83,8 @@ class DataStatistics(BaseModel):
     Note:
         This class is typically not instantiated directly. Instead, access it
         through the computed `statistics` property of a DiffractionData instance.
+        It is a frozen, slotted dataclass rather than a pydantic model, since
+        its values are always computed internally and need no validation.
 
     Example:
         >>> data = DiffractionData(q_values=q_vals, intensities=intensities)
@@ -80,15 +93,34 @@ class DataStatistics(BaseModel):
         >>> print(f"Q sampling uniformity: {uniformity:.1f}%")
     """
 
-    num_points: int = Field(description="Number of data points")
-    q_range: tuple[float, float] = Field(description="Q range (min, max) in Å⁻¹")
-    q_step_mean: float = Field(description="Mean Q step size in Å⁻¹")
-    q_step_std: float = Field(description="Standard deviation of Q step size")
-    intensity_range: tuple[float, float] = Field(
-        description="Intensity range (min, max)"
-    )
-    intensity_mean: float = Field(description="Mean intensity")
-    intensity_std: float = Field(description="Standard deviation of intensity")
+    num_points: int
+    q_range: tuple[float, float]
+    q_step_mean: float
+    q_step_std: float
+    intensity_range: tuple[float, float]
+    intensity_mean: float
+    intensity_std: float
+
+
+def _gather_columns(
+    q_values: np.ndarray, intensities: np.ndarray, indices: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Reorder Q and intensities into the two columns of one 2-D block.
+
+    The block is Fortran-ordered, so each column is a contiguous view, laid
+    out like the columns returned by the file loaders. Arrays that cannot
+    share a block (different dtypes or not 1-D) are gathered separately.
+    """
+    if (
+        q_values.ndim == 1
+        and intensities.ndim == 1
+        and q_values.dtype == intensities.dtype
+    ):
+        block = np.empty((indices.size, 2), dtype=q_values.dtype, order="F")
+        np.take(q_values, indices, out=block[:, 0])
+        np.take(intensities, indices, out=block[:, 1])
+        return block[:, 0], block[:, 1]
+    return q_values[indices], intensities[indices]
 
 
 class DiffractionData(BaseModel):
@@ -191,20 +223,49 @@ class DiffractionData(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    # Statistics computed on first access, stored with the arrays they were
+    # computed from. Holding the arrays (not their ids) means a reassigned or
+    # copied-with-update field can never match a stale entry
+    _statistics: tuple[np.ndarray, np.ndarray, DataStatistics] | None = PrivateAttr(
+        default=None
+    )
+
     def model_post_init(self, __context: Any) -> None:
         """Validate data after initialization."""
-        if len(self.q_values) != len(self.intensities):
+        num_points = self.q_values.shape[0]
+        if num_points != self.intensities.shape[0]:
             raise ValueError("Q values and intensities must have the same length")
 
-        if len(self.q_values) == 0:
+        if num_points == 0:
             raise ValueError("Data arrays cannot be empty")
 
         # Ensure Q values are sorted
-        if not np.all(self.q_values[:-1] <= self.q_values[1:]):
-            # Sort both arrays by Q values
-            sort_indices = np.argsort(self.q_values)
-            object.__setattr__(self, "q_values", self.q_values[sort_indices])
-            object.__setattr__(self, "intensities", self.intensities[sort_indices])
+        if not _Q_PRESORTED.get() and not is_sorted(self.q_values):
+            # Sort both arrays by Q values; a stable sort keeps repeated Q
+            # points in file order
+            sort_indices = np.argsort(self.q_values, kind="stable")
+            q_values, intensities = _gather_columns(
+                self.q_values, self.intensities, sort_indices
+            )
+            object.__setattr__(self, "q_values", q_values)
+            object.__setattr__(self, "intensities", intensities)
+
+    @classmethod
+    def _unchecked(
+        cls, q_values: np.ndarray, intensities: np.ndarray, **kwargs: Any
+    ) -> "DiffractionData":
+        """Build an instance from trusted arrays already sorted by Q.
+
+        Skips pydantic field validation and the O(N) sortedness check. The
+        length and emptiness checks still run.
+        """
+        token = _Q_PRESORTED.set(True)
+        try:
+            return cls.model_construct(
+                q_values=q_values, intensities=intensities, **kwargs
+            )
+        finally:
+            _Q_PRESORTED.reset(token)
 
     @computed_field
     def statistics(self) -> DataStatistics:
@@ -213,7 +274,7 @@ class DiffractionData(BaseModel):
 
         This computed field automatically calculates quality metrics and statistical
         properties of the powder diffraction pattern. The computation is performed
-        on-demand and cached for efficiency.
+        on-demand and cached on the instance.
 
         Returns:
             DataStatistics: Object containing all computed quality metrics including:
@@ -242,27 +303,52 @@ class DiffractionData(BaseModel):
             >>> print(f"Signal-to-noise estimate: {snr:.1f}")
 
         Note:
-            This is a computed field, so it will be recalculated automatically
-            if the underlying data changes, but results are cached for efficiency.
+            The result is computed on first access and cached against the
+            current ``q_values`` and ``intensities`` arrays. Replacing either
+            array (by assignment or ``model_copy(update=...)``) invalidates
+            it; modifying the arrays in place does not.
         """
-        q_diff = np.diff(self.q_values)
-
-        return DataStatistics(
+        cached = self._statistics
+        if (
+            cached is not None
+            and cached[0] is self.q_values
+            and cached[1] is self.intensities
+        ):
+            return cached[2]
+
+        (
+            q_min,
+            q_max,
+            intensity_min,
+            intensity_max,
+            intensity_mean,
+            intensity_std,
+            q_step_mean,
+            q_step_std,
+        ) = pattern_stats(self.q_values, self.intensities)
+
+        statistics = DataStatistics(
             num_points=len(self.q_values),
-            q_range=(float(self.q_values.min()), float(self.q_values.max())),
-            q_step_mean=float(q_diff.mean()),
-            q_step_std=float(q_diff.std()),
-            intensity_range=(
-                float(self.intensities.min()),
-                float(self.intensities.max()),
-            ),
-            intensity_mean=float(self.intensities.mean()),
-            intensity_std=float(self.intensities.std()),
+            q_range=(q_min, q_max),
+            q_step_mean=q_step_mean,
+            q_step_std=q_step_std,
+            intensity_range=(intensity_min, intensity_max),
+            intensity_mean=intensity_mean,
+            intensity_std=intensity_std,
         )
+        self._statistics = (self.q_values, self.intensities, statistics)
+        return statistics
 
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self, copy: bool = True) -> "pd.DataFrame":
         """Convert diffraction data to a pandas DataFrame for analysis.
 
+        Args:
+            copy: Copy the arrays into the DataFrame (default). Pass False
+                for a zero-copy frame whose columns view this instance's
+                arrays; use it for read-only work such as export or
+                plotting, since writes to the frame would modify (or, for
+                read-only cached arrays, fail on) the underlying data.
+
         Returns:
             pd.DataFrame: DataFrame with columns 'Q' and 'intensity' containing
                 all data points for convenient data analysis and manipulation.
@@ -273,12 +359,17 @@ class DiffractionData(BaseModel):
             >>> print(df.columns.tolist())
             ['Q', 'intensity']
         """
-        return pd.DataFrame({"Q": self.q_values, "intensity": self.intensities})
+        # pandas is imported lazily; only the DataFrame interop needs it
+        import pandas as pd
+
+        return pd.DataFrame(
+            {"Q": self.q_values, "intensity": self.intensities}, copy=copy
+        )
 
     @classmethod
     def from_dataframe(
         cls,
-        df: pd.DataFrame,
+        df: "pd.DataFrame",
         filename: str | None = None,
         sample_name: str | None = None,
         **kwargs: Any,
@@ -304,13 +395,19 @@ class DiffractionData(BaseModel):
             >>> data = DiffractionData.from_dataframe(df, filename="test.chi")
             >>> print(data.num_points)
             2
+
+        Note:
+            Columns backed by contiguous NumPy arrays are not copied, so the
+            new instance's arrays may share memory with ``df`` (unless they
+            had to be sorted by Q). Strided columns, e.g. from a frame built
+            on a row-major 2-D array, are copied into contiguous arrays.
         """
         if "Q" not in df.columns or "intensity" not in df.columns:
             raise ValueError("DataFrame must contain 'Q' and 'intensity' columns")
 
         return cls(
-            q_values=np.asarray(df["Q"].values),
-            intensities=np.asarray(df["intensity"].values),
+            q_values=np.ascontiguousarray(df["Q"].to_numpy(copy=False)),
+            intensities=np.ascontiguousarray(df["intensity"].to_numpy(copy=False)),
             filename=filename,
             sample_name=sample_name,
             **kwargs,
@@ -367,16 +464,21 @@ class DiffractionData(BaseModel):
             >>> print(trimmed.q_range)
             (1.0, 1.5)
         """
-        mask = np.ones(len(self.q_values), dtype=bool)
-
-        if q_min is not None:
-            mask &= self.q_values >= q_min
-        if q_max is not None:
-            mask &= self.q_values <= q_max
+        # Q is sorted, so the range is a contiguous slice (a view, not a copy)
+        start = (
+            0
+            if q_min is None
+            else int(np.searchsorted(self.q_values, q_min, side="left"))
+        )
+        stop = (
+            len(self.q_values)
+            if q_max is None
+            else int(np.searchsorted(self.q_values, q_max, side="right"))
+        )
 
-        return self.__class__(
-            q_values=self.q_values[mask],
-            intensities=self.intensities[mask],
+        return self._unchecked(
+            q_values=self.q_values[start:stop],
+            intensities=self.intensities[start:stop],
             filename=self.filename,
             sample_name=self.sample_name,
             timestamp=self.timestamp,
@@ -23,6 +23,7 @@ Supported Formats:
 Functions:
     - load_diffraction_file_df(): Load .chi/.xy files into DataFrames
     - load_chi_file(): Backward-compatible wrapper for chi files
+    - load_diffraction_files_df(): Load several files concurrently
     - get_data_info(): Extract statistical summaries from DataFrames
     - load_test_data(): Load SRM 660b test dataset as DataFrame
 
@@ -43,14 +44,29 @@ Warning:
     use `robomage.data.loaders` for enhanced functionality and validation.
 """
 
+import functools
+import os
+import warnings
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, Literal
 
 import numpy as np
-import pandas as pd
 
+from .data._kernels import pattern_stats
+from .data.loaders import load_test_data as _load_test_data_model
+from .data.loaders import read_table_df
 
-def load_diffraction_file_df(filepath: str | Path) -> pd.DataFrame:
+if TYPE_CHECKING:
+    import pandas as pd
+
+_VALID_SUFFIXES = frozenset({".chi", ".xy"})
+
+
+def load_diffraction_file_df(
+    filepath: str | Path, precision: Literal["float64", "float32"] = "float64"
+) -> "pd.DataFrame":
     """Load a diffraction data file (.chi or .xy) into a DataFrame.
 
     This is the legacy DataFrame-based loader for diffraction files. For new code,
@@ -67,6 +83,9 @@ def load_diffraction_file_df(filepath: str | Path) -> pd.DataFrame:
 
     Args:
         filepath: Path to the diffraction file to load. Can be a string or Path object.
+        precision: Column dtype, "float64" (default) or "float32". float32
+            halves the memory of the frame and keeps ~7 significant digits,
+            which is enough for most Q/intensity work.
 
     Returns:
         pd.DataFrame: DataFrame with columns ['Q', 'intensity'] containing
@@ -75,7 +94,8 @@ def load_diffraction_file_df(filepath: str | Path) -> pd.DataFrame:
     Raises:
         FileNotFoundError: If the specified file doesn't exist.
         ValueError: If the file extension is not '.chi' or '.xy', the file doesn't
-            contain exactly 2 columns, or parsing fails for any reason.
+            contain exactly 2 columns, parsing fails for any reason, or
+            precision is not "float64" or "float32".
 
     Note:
         - Comment lines (starting with '#') are automatically ignored
@@ -94,37 +114,77 @@ def load_diffraction_file_df(filepath: str | Path) -> pd.DataFrame:
     See Also:
         robomage.data.loaders.load_diffraction_file: Modern API with validation
     """
+    if precision not in ("float64", "float32"):
+        raise ValueError(
+            f"Unsupported precision: {precision!r}. Use 'float64' or 'float32'"
+        )
+
     filepath = Path(filepath)
 
-    if filepath.suffix.lower() not in [".chi", ".xy"]:
+    if filepath.suffix.lower() not in _VALID_SUFFIXES:
         raise ValueError(f"Expected .chi or .xy file, got: {filepath.suffix}")
 
-    if not filepath.exists():
-        raise FileNotFoundError(f"File not found: {filepath}")
+    # One stat both checks that the file exists and keys the parse cache
+    stat: os.stat_result | None
+    try:
+        stat = filepath.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {filepath}") from None
+    except OSError:
+        stat = None
 
     try:
-        # Read the file, skipping comment lines that start with #
-        data = np.loadtxt(filepath, comments="#")
+        # Reuse frames parsed from the same unchanged file; fall back to a
+        # direct parse if the file cannot be stat'ed
+        if stat is None:
+            df = _read_diffraction_df(filepath)
+        else:
+            df = _read_diffraction_df_cached(
+                str(filepath.resolve()), stat.st_mtime_ns, stat.st_size
+            )
+
+        # Both branches return a new frame, so callers can't modify the cache
+        result: pd.DataFrame = (
+            df.astype(np.float32) if precision == "float32" else df.copy()
+        )
+        return result
 
-        if data.shape[1] != 2:
-            raise ValueError(f"Expected 2 columns, got {data.shape[1]}")
+    except Exception as e:
+        raise ValueError(f"Failed to parse {filepath}: {e}") from e
 
-        # Create DataFrame with meaningful column names
-        df = pd.DataFrame(data, columns=["Q", "intensity"])
 
-        return df
+def _read_diffraction_df(filepath: str | Path) -> "pd.DataFrame":
+    """Parse a two-column diffraction file into a Q/intensity DataFrame."""
+    # Shares the modern loaders' reader, skipping '#' comment lines. Columns
+    # are named after the count check, since names= would silently turn
+    # extra columns into the index
+    df = read_table_df(filepath)
+
+    if df.shape[1] != 2:
+        raise ValueError(f"Expected 2 columns, got {df.shape[1]}")
+
+    # Create DataFrame with meaningful column names
+    df.columns = ["Q", "intensity"]
+
+    return df
 
-    except Exception as e:
-        raise ValueError(f"Failed to parse {filepath}: {e}") from e
 
+@functools.lru_cache(maxsize=32)
+def _read_diffraction_df_cached(path: str, mtime_ns: int, size: int) -> "pd.DataFrame":
+    """Parse a diffraction file, memoized on its resolved path, mtime and size."""
+    return _read_diffraction_df(path)
 
-def load_chi_file(filepath: str | Path) -> pd.DataFrame:
+
+def load_chi_file(
+    filepath: str | Path, precision: Literal["float64", "float32"] = "float64"
+) -> "pd.DataFrame":
     """Load a .chi file containing Q and intensity data into a DataFrame.
 
     Backward compatibility wrapper for load_diffraction_file_df().
 
     Args:
         filepath: Path to the .chi file to load.
+        precision: Column dtype, "float64" (default) or "float32".
 
     Returns:
         pd.DataFrame: DataFrame with columns ['Q', 'intensity'].
@@ -133,10 +193,49 @@ def load_chi_file(filepath: str | Path) -> pd.DataFrame:
         This function now supports both .chi and .xy files for convenience.
         For new code, consider using robomage.data.loaders instead.
     """
-    return load_diffraction_file_df(filepath)
+    return load_diffraction_file_df(filepath, precision=precision)
+
+
+def load_diffraction_files_df(
+    filepaths: Iterable[str | Path],
+    max_workers: int | None = None,
+    precision: Literal["float64", "float32"] = "float64",
+) -> "dict[Path, pd.DataFrame]":
+    """Load several diffraction data files into DataFrames concurrently.
 
+    Each file is loaded with load_diffraction_file_df() on a thread pool;
+    pandas' C parser releases the GIL while tokenizing, so reads and parses
+    of different files overlap.
 
-def get_data_info(df: pd.DataFrame) -> dict[str, Any]:
+    Args:
+        filepaths: Paths to the .chi/.xy files to load.
+        max_workers: Maximum number of worker threads. Defaults to the
+            ThreadPoolExecutor default.
+        precision: Column dtype, "float64" (default) or "float32".
+
+    Returns:
+        dict[Path, pd.DataFrame]: DataFrames keyed by path, in input order.
+
+    Raises:
+        FileNotFoundError: If a file doesn't exist.
+        ValueError: If a file has an unsupported extension or cannot be parsed.
+
+    Example:
+        >>> from pathlib import Path
+        >>> from robomage.data_io import load_diffraction_files_df
+        >>> frames = load_diffraction_files_df(Path("run_042").glob("*.chi"))
+        >>> print(f"Loaded {len(frames)} files")
+    """
+    paths = [Path(filepath) for filepath in filepaths]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frames = executor.map(
+            functools.partial(load_diffraction_file_df, precision=precision), paths
+        )
+        return dict(zip(paths, frames, strict=True))
+
+
+def get_data_info(df: "pd.DataFrame") -> dict[str, Any]:
     """Get comprehensive summary statistics for diffraction data.
 
     Extracts key statistical information from a DataFrame containing
@@ -162,6 +261,8 @@ def get_data_info(df: pd.DataFrame) -> dict[str, Any]:
     Note:
         - Q spacing statistics help assess data quality and uniformity
         - Large q_step_std indicates non-uniform sampling
+        - Standard deviations are sample (ddof=1) values, as in pandas
+        - NaN values are skipped, as in the pandas reductions
         - For validated data objects with richer statistics, use
           DiffractionData.statistics property instead
 
@@ -176,18 +277,77 @@ def get_data_info(df: pd.DataFrame) -> dict[str, Any]:
     See Also:
         DiffractionData.statistics: Modern API with computed statistics
     """
+    # Reduce the raw column buffers in one shared pass instead of separate
+    # pandas reductions (and two Series from Q.diff())
+    q_values = df["Q"].to_numpy(dtype=np.float64)
+    intensities = df["intensity"].to_numpy(dtype=np.float64)
+    num_points = len(q_values)
+    if num_points == 0:
+        return {
+            "num_points": 0,
+            "q_range": (np.nan, np.nan),
+            "q_step_mean": np.nan,
+            "q_step_std": np.nan,
+            "intensity_range": (np.nan, np.nan),
+            "intensity_mean": np.nan,
+            "intensity_std": np.nan,
+        }
+
+    (
+        q_min,
+        q_max,
+        intensity_min,
+        intensity_max,
+        intensity_mean,
+        intensity_std,
+        q_step_mean,
+        q_step_std,
+    ) = pattern_stats(q_values, intensities)
+    if np.isnan(q_min) or np.isnan(intensity_min):
+        # The kernel propagates NaN; redo the (rare) NaN case skipping them
+        return _nan_data_info(q_values, intensities)
+
+    # pattern_stats returns population values; keep pandas' sample (ddof=1)
+    # standard deviations here
+    num_steps = num_points - 1
     return {
-        "num_points": len(df),
-        "q_range": (df["Q"].min(), df["Q"].max()),
-        "q_step_mean": float(df["Q"].diff().mean()),  # type: ignore[misc]
-        "q_step_std": float(df["Q"].diff().std()),  # type: ignore[misc]
-        "intensity_range": (df["intensity"].min(), df["intensity"].max()),
-        "intensity_mean": float(df["intensity"].mean()),
-        "intensity_std": float(df["intensity"].std()),
+        "num_points": num_points,
+        "q_range": (q_min, q_max),
+        "q_step_mean": q_step_mean,
+        "q_step_std": (
+            q_step_std * np.sqrt(num_steps / (num_steps - 1))
+            if num_steps > 1
+            else np.nan
+        ),
+        "intensity_range": (intensity_min, intensity_max),
+        "intensity_mean": intensity_mean,
+        "intensity_std": (
+            intensity_std * np.sqrt(num_points / num_steps) if num_steps else np.nan
+        ),
     }
 
 
-def load_test_data() -> pd.DataFrame:
+def _nan_data_info(q_values: np.ndarray, intensities: np.ndarray) -> dict[str, Any]:
+    """get_data_info statistics for data with NaNs, skipping them like pandas."""
+    q_steps = np.diff(q_values)
+    # All-NaN or too-short columns give NaN, as pandas does, without warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return {
+            "num_points": len(q_values),
+            "q_range": (float(np.nanmin(q_values)), float(np.nanmax(q_values))),
+            "q_step_mean": float(np.nanmean(q_steps)),
+            "q_step_std": float(np.nanstd(q_steps, ddof=1)),
+            "intensity_range": (
+                float(np.nanmin(intensities)),
+                float(np.nanmax(intensities)),
+            ),
+            "intensity_mean": float(np.nanmean(intensities)),
+            "intensity_std": float(np.nanstd(intensities, ddof=1)),
+        }
+
+
+def load_test_data() -> "pd.DataFrame":
     """Load the standard test dataset (SRM 660b LaB₆) as a DataFrame.
 
     Loads the SRM 660b (LaB₆) powder diffraction standard from NIST as a
@@ -229,13 +389,8 @@ def load_test_data() -> pd.DataFrame:
     See Also:
         robomage.data.loaders.load_test_data: Modern API with validation
     """
-    # Get the project root directory
-    current_file = Path(__file__)
-    project_root = current_file.parents[2]  # Go up from src/robomage/data_io.py to root
-
-    test_file = project_root / "examples" / "pdf_SRM_660b_q.chi"
-
-    if not test_file.exists():
-        raise FileNotFoundError(f"Test data file not found: {test_file}")
-
-    return load_chi_file(test_file)
+    # The modern loader reads the parsed arrays from a .npy cache in the
+    # user cache directory instead of re-parsing the text on every call.
+    # The SRM 660b data is already sorted by Q, so this matches a direct
+    # load of the .chi file
+    return _load_test_data_model().to_dataframe()
@@ -0,0 +1,34 @@
+"""
+Shared pytest fixtures for the RoboMage test suite.
+"""
+
+import socket
+
+import pytest
+
+from robomage.data import load_diffraction_file
+
+
+@pytest.fixture(scope="session")
+def free_port():
+    """Pick a free local TCP port, so parallel workers don't collide."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture(scope="session")
+def loaded_xy():
+    """Load diffraction files once per session, keyed by path.
+
+    Tests must treat the returned data as read-only, since it is shared.
+    """
+    cache = {}
+
+    def load(filepath):
+        key = str(filepath)
+        if key not in cache:
+            cache[key] = load_diffraction_file(filepath)
+        return cache[key]
+
+    return load
@@ -12,16 +12,42 @@ plotly = pytest.importorskip("plotly")
 pytest.importorskip("dash_bootstrap_components")
 
 
-def test_dashboard_imports():
+@pytest.fixture
+def cache_dirs(tmp_path):
+    """Cache directories for create_app, kept out of shared locations."""
+    return {
+        "data_cache_dir": tmp_path / "data",
+        "background_cache_dir": tmp_path / "background",
+    }
+
+
+def test_dashboard_imports(cache_dirs):
     """Test that dashboard components can be imported successfully."""
     from robomage.dashboard.app import create_app
 
     # Test app creation
-    app = create_app()
+    app = create_app(**cache_dirs)
     assert app is not None
     assert app.title == "RoboMage Dashboard"
 
 
+def test_precomputed_layout_response(cache_dirs):
+    """Test that /_dash-layout serves the pre-serialized layout JSON."""
+    import json
+
+    from robomage.dashboard.app import create_app
+
+    app = create_app(**cache_dirs)
+    client = app.server.test_client()
+
+    first = client.get("/_dash-layout")
+    second = client.get("/_dash-layout")
+    assert first.status_code == 200
+    assert first.mimetype == "application/json"
+    assert first.data == second.data
+    assert json.loads(first.data)["props"]["fluid"] is True
+
+
 def test_main_layout_creation():
     """Test that the main layout can be created."""
     from robomage.dashboard.layouts.main_layout import create_main_layout
@@ -58,6 +84,85 @@ def test_file_parsing():
     assert result["intensity"] == [100, 200, 150]
 
 
+def test_file_parsing_irregular_lines():
+    """Test that files the fast parser rejects fall back to line parsing."""
+    import base64
+
+    from robomage.dashboard.callbacks.file_upload import parse_uploaded_file
+
+    test_data = "! Instrument header\nQ Intensity\n1.0 100\n2.0\n3.0 150\n"
+    encoded_content = base64.b64encode(test_data.encode()).decode()
+    content = f"data:text/plain;base64,{encoded_content}"
+
+    result = parse_uploaded_file(content, "irregular.chi")
+
+    assert result["q"] == [1.0, 3.0]
+    assert result["intensity"] == [100, 150]
+    assert result["metadata"]["comments"] == ["! Instrument header"]
+
+
+def test_file_list_components():
+    """Test file list entries and status text used by patched updates."""
+    from robomage.dashboard.callbacks.file_upload import (
+        create_file_list,
+        create_file_list_item,
+        create_status_text,
+    )
+
+    file_data = {"num_points": 3}
+    item = create_file_list_item("test.chi", file_data)
+    assert item.id == {"type": "file-item", "filename": "test.chi"}
+
+    # The patched path appends to/deletes from the ListGroup's children
+    file_list = create_file_list({"a.chi": file_data, "b.chi": file_data})
+    assert len(file_list) == 1
+    assert [entry.id["filename"] for entry in file_list[0].children] == [
+        "a.chi",
+        "b.chi",
+    ]
+
+    assert create_status_text(0) == "No files loaded"
+    assert create_status_text(1) == "Loaded 1 file"
+    assert create_status_text(3) == "Loaded 3 files"
+
+
+def test_server_side_data_cache(tmp_path):
+    """Test that store entries carry a cache key instead of the arrays."""
+    from robomage.dashboard.app import create_app
+    from robomage.dashboard.utils import data_cache
+    from robomage.dashboard.utils.data_cache import (
+        cache_file_data,
+        evict_file_data,
+        hydrate_file_data,
+    )
+
+    # The cache is opened lazily, in the directory given to create_app
+    create_app(
+        data_cache_dir=tmp_path / "data",
+        background_cache_dir=tmp_path / "background",
+    )
+    assert data_cache._data_cache is None
+
+    parsed = {
+        "filename": "test.chi",
+        "q": [1.0, 2.0, 3.0],
+        "intensity": [100, 200, 150],
+        "num_points": 3,
+    }
+    entry = cache_file_data(parsed)
+    assert "q" not in entry and "intensity" not in entry
+    assert entry["num_points"] == 3
+
+    hydrated = hydrate_file_data(entry)
+    assert hydrated["q"].tolist() == [1.0, 2.0, 3.0]
+    assert hydrated["intensity"].tolist() == [100, 200, 150]
+
+    assert (tmp_path / "data").is_dir()
+
+    evict_file_data(entry)
+    assert hydrate_file_data(entry) is None
+
+
 def test_plotting_functions():
     """Test plotting utility functions."""
 
@@ -85,5 +190,134 @@ def test_plotting_functions():
     assert fig is not None
 
 
+def test_clientside_view_callbacks(cache_dirs):
+    """Test that browser-only updates are registered as clientside callbacks."""
+    from robomage.dashboard.app import create_app
+
+    app = create_app(**cache_dirs)
+    functions = {
+        callback["clientside_function"]["function_name"]
+        for callback in app._callback_list
+        if callback.get("clientside_function")
+    }
+    assert functions == {"updatePlotType", "toggleFullscreen", "checkServiceHealth"}
+
+
+def test_plot_downsampling():
+    """Test viewport downsampling keeps peaks and bounds the point count."""
+    import numpy as np
+
+    from robomage.dashboard.utils.downsampling import (
+        downsample_trace,
+        get_viewport_range,
+        minmax_downsample,
+    )
+
+    q = np.linspace(0.5, 25.0, 100_000)
+    intensity = np.ones_like(q)
+    intensity[61_234] = 5000.0  # sharp single-point peak
+
+    x_data, y_data = downsample_trace(q, intensity, n_out=1000)
+    assert len(x_data) <= 1000
+    assert x_data[0] == q[0] and x_data[-1] == q[-1]
+    assert max(y_data) == 5000.0
+
+    # Small traces are passed through untouched, even with a zoom range
+    x_small, y_small = downsample_trace([1.0, 2.0, 3.0], [100, 200, 150])
+    assert x_small == [1.0, 2.0, 3.0]
+    assert y_small == [100, 200, 150]
+    x_small, _ = downsample_trace([1.0, 2.0, 3.0, 4.0], [1, 2, 3, 4], (2.0, 2.5))
+    assert x_small == [1.0, 2.0, 3.0, 4.0]
+
+    # Points in the remainder after the last full bucket are still kept
+    tail = np.ones(1009)
+    tail[1005] = 5000.0
+    assert 1005 in minmax_downsample(tail, 10)
+
+    # Zooming narrows the trace to the viewport plus one point either side
+    x_range = get_viewport_range({"xaxis.range[0]": 10.0, "xaxis.range[1]": 10.01})
+    x_zoom, _ = downsample_trace(q, intensity, x_range, n_out=1000)
+    assert x_zoom[0] < 10.0 < x_zoom[1]
+    assert x_zoom[-2] < 10.01 < x_zoom[-1]
+
+    assert get_viewport_range({"xaxis.autorange": True}) is None
+    assert get_viewport_range({"autosize": True}) is None
+
+
+def test_main_plot_viewport_after_axis_switch(cache_dirs):
+    """Test that an x-axis unit switch drops the zoom range in the old units."""
+    from contextvars import copy_context
+
+    import numpy as np
+    from dash._callback_context import context_value
+    from dash._utils import AttributeDict
+
+    from robomage.dashboard.app import create_app
+
+    app = create_app(**cache_dirs)
+    update_main_plot = app.callback_map[
+        "..main-plot.figure...main-plot.relayoutData.."
+    ]["callback"].__wrapped__
+
+    q = np.linspace(1.0, 10.0, 10_000)
+    file_data = {"a.chi": {"q": q, "intensity": np.sin(q), "num_points": len(q)}}
+    zoom = {"xaxis.range[0]": 2.0, "xaxis.range[1]": 3.0}
+
+    def run(prop_id, x_axis, relayout_data):
+        def call():
+            context_value.set(
+                AttributeDict(triggered_inputs=[{"prop_id": prop_id, "value": None}])
+            )
+            return update_main_plot(
+                file_data, None, x_axis, "raw", None, relayout_data, "line"
+            )
+
+        return copy_context().run(call)
+
+    # Other inputs keep the zoomed resolution
+    figure, relayout_update = run("y-axis-selector.value", "q", zoom)
+    assert min(figure["data"][0]["x"]) > 1.9
+    assert relayout_update is dash.no_update
+
+    # Switching units plots the full trace and clears the stale range
+    figure, relayout_update = run("x-axis-selector.value", "d_spacing", zoom)
+    x_data = figure["data"][0]["x"]
+    assert min(x_data) == pytest.approx(2 * np.pi / 10.0)
+    assert max(x_data) == pytest.approx(2 * np.pi)
+    assert relayout_update is None
+
+
+def test_export_failure_shows_alert(cache_dirs):
+    """Test that a failed server-side export is reported in the UI."""
+    from unittest.mock import patch
+
+    from robomage.dashboard.app import create_app
+
+    app = create_app(**cache_dirs)
+    export_main_plot = app.callback_map[
+        "..plot-download.data...export-alert.children...export-alert.is_open.."
+    ]["callback"].__wrapped__
+    figure = {"data": [{"type": "scatter", "x": [1, 2], "y": [3, 4]}]}
+
+    with patch(
+        "robomage.dashboard.callbacks.plotting.render_figure_png",
+        side_effect=RuntimeError("Kaleido requires Google Chrome"),
+    ):
+        download, message, is_open = export_main_plot(1, figure)
+
+    assert download is dash.no_update
+    assert is_open is True
+    assert "Kaleido requires Google Chrome" in str(message)
+
+    with patch(
+        "robomage.dashboard.callbacks.plotting.render_figure_png",
+        return_value=b"png",
+    ):
+        download, _, is_open = export_main_plot(1, figure)
+
+    assert download["filename"] == "diffraction_pattern.png"
+    assert is_open is False
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -164,15 +164,23 @@ def test_analysis_callback_registration():
 
 def test_ui_component_ids():
     """Test that expected component IDs exist in layout."""
-    from robomage.dashboard.layouts.main_layout import create_analysis_tab
+    from robomage.dashboard.layouts.main_layout import (
+        create_analysis_controls,
+        create_analysis_tab,
+    )
 
     layout = create_analysis_tab()
     layout_str = str(layout)
 
     # Check for key component IDs
-    assert "run-analysis-btn" in layout_str
+    assert "analysis-controls-slot" in layout_str
     assert "analysis-summary" in layout_str
     assert "service-status-badge" in layout_str
-    assert "profile-selector" in layout_str
-    assert "min-prominence-input" in layout_str
-    assert "min-distance-input" in layout_str
+
+    # Controls are rendered into the slot once data is loaded
+    controls_str = str(create_analysis_controls())
+    assert "run-analysis-btn" not in layout_str
+    assert "run-analysis-btn" in controls_str
+    assert "profile-selector" in controls_str
+    assert "min-prominence-input" in controls_str
+    assert "min-distance-input" in controls_str
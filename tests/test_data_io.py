@@ -2,10 +2,17 @@
 
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
-from robomage.data_io import get_data_info, load_chi_file, load_test_data
+from robomage.data_io import (
+    get_data_info,
+    load_chi_file,
+    load_diffraction_file_df,
+    load_diffraction_files_df,
+    load_test_data,
+)
 
 
 def test_load_test_data():
@@ -51,6 +58,41 @@ def test_get_data_info():
     assert info["intensity_range"][0] <= info["intensity_range"][1]
 
 
+@pytest.mark.parametrize("force_numpy", [False, True])
+def test_get_data_info_skips_nan(monkeypatch, force_numpy):
+    """Test that NaNs are skipped like pandas, with and without numba."""
+    from robomage.data import _kernels
+
+    if force_numpy:
+        monkeypatch.setattr(_kernels, "njit", None)
+
+    df = pd.DataFrame(
+        {
+            "Q": [1.0, np.nan, 3.0, 4.0, 5.5],
+            "intensity": [1.0, np.nan, 3.0, 0.5, 2.0],
+        }
+    )
+    info = get_data_info(df)
+
+    q_steps = df["Q"].diff()
+    expected = {
+        "num_points": 5,
+        "q_range": (df["Q"].min(), df["Q"].max()),
+        "q_step_mean": q_steps.mean(),
+        "q_step_std": q_steps.std(),
+        "intensity_range": (df["intensity"].min(), df["intensity"].max()),
+        "intensity_mean": df["intensity"].mean(),
+        "intensity_std": df["intensity"].std(),
+    }
+    assert info.keys() == expected.keys()
+    for key, value in expected.items():
+        np.testing.assert_allclose(info[key], value, rtol=1e-12)
+
+    all_nan = get_data_info(pd.DataFrame({"Q": [np.nan], "intensity": [np.nan]}))
+    assert np.isnan(all_nan["q_range"]).all()
+    assert np.isnan(all_nan["intensity_std"])
+
+
 def test_load_chi_file_directly():
     """Test loading the chi file directly."""
     # Get project root and test file path
@@ -66,6 +108,61 @@ def test_load_chi_file_directly():
     assert len(df) > 0
 
 
+def test_load_diffraction_file_df_cache(tmp_path):
+    """Test that repeat loads reuse the parse but return independent frames."""
+    xy_file = tmp_path / "pattern.xy"
+    xy_file.write_text("1.0 10.0\n2.0 20.0\n")
+
+    first = load_diffraction_file_df(xy_file)
+    first["intensity"] *= 2
+    second = load_diffraction_file_df(xy_file)
+
+    assert second["intensity"].tolist() == [10.0, 20.0]
+
+    xy_file.write_text("1.0 10.0\n2.0 20.0\n3.0 30.0\n")
+    assert len(load_diffraction_file_df(xy_file)) == 3
+
+
+def test_load_diffraction_file_df_nan_values(tmp_path):
+    """Test that literal NaN fields load as NaN, as np.loadtxt did."""
+    chi_file = tmp_path / "pattern.chi"
+    chi_file.write_text("# Q I\n1.0 10.0\n2.0 nan\n3.0 NaN\n")
+
+    df = load_chi_file(chi_file)
+
+    np.testing.assert_array_equal(df["Q"], [1.0, 2.0, 3.0])
+    np.testing.assert_array_equal(df["intensity"], [10.0, np.nan, np.nan])
+
+
+def test_load_diffraction_files_df(tmp_path):
+    """Test concurrent loading keyed by path in input order."""
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"pattern_{i}.xy"
+        path.write_text(f"1.0 {i}.0\n2.0 {i}.5\n")
+        paths.append(path)
+
+    frames = load_diffraction_files_df(reversed(paths), max_workers=2)
+
+    assert list(frames) == paths[::-1]
+    assert [df["intensity"].iloc[0] for df in frames.values()] == [2.0, 1.0, 0.0]
+
+
+def test_load_float32_precision():
+    """Test opting into float32 columns."""
+    test_file = Path(__file__).parents[1] / "examples" / "pdf_SRM_660b_q.chi"
+
+    df64 = load_chi_file(test_file)
+    df32 = load_chi_file(test_file, precision="float32")
+
+    assert df32.dtypes.tolist() == [np.float32, np.float32]
+    assert df64.dtypes.tolist() == [np.float64, np.float64]
+    np.testing.assert_allclose(df32.to_numpy(), df64.to_numpy(), rtol=1e-6)
+
+    with pytest.raises(ValueError, match="Unsupported precision"):
+        load_chi_file(test_file, precision="float16")  # type: ignore[arg-type]
+
+
 def test_load_nonexistent_file():
     """Test that loading a nonexistent file raises appropriate error."""
     with pytest.raises(FileNotFoundError):
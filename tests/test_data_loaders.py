@@ -4,9 +4,16 @@ from pathlib import Path
 from unittest.mock import patch
 
 import numpy as np
+import pandas as pd
 import pytest
 
-from robomage.data.loaders import load_chi_file, load_diffraction_file
+from robomage.data.loaders import (
+    _parse_chi_cached,
+    load_chi_file,
+    load_diffraction_file,
+    load_many,
+    load_test_data,
+)
 from robomage.data.models import DiffractionData
 
 
@@ -21,14 +28,14 @@ def test_load_chi_file_validation():
         load_chi_file("nonexistent.chi")
 
 
-@patch("numpy.loadtxt")
+@patch("pandas.read_csv")
 @patch("pathlib.Path.exists")
-def test_load_chi_file_success(mock_exists, mock_loadtxt):
+def test_load_chi_file_success(mock_exists, mock_read_csv):
     """Test successful loading of a .chi file."""
     # Mock file existence and data
     mock_exists.return_value = True
-    mock_data = np.array([[1.0, 100.0], [2.0, 200.0], [3.0, 150.0]])
-    mock_loadtxt.return_value = mock_data
+    mock_data = pd.DataFrame([[1.0, 100.0], [2.0, 200.0], [3.0, 150.0]])
+    mock_read_csv.return_value = mock_data
 
     # Load the file
     result = load_chi_file("test.chi")
@@ -39,31 +46,32 @@ def test_load_chi_file_success(mock_exists, mock_loadtxt):
     np.testing.assert_array_equal(result.q_values, [1.0, 2.0, 3.0])
     np.testing.assert_array_equal(result.intensities, [100.0, 200.0, 150.0])
 
-    # Verify numpy.loadtxt was called correctly
-    mock_loadtxt.assert_called_once()
-    args, kwargs = mock_loadtxt.call_args
-    assert kwargs.get("comments") == "#"
-
-
-@patch("numpy.loadtxt")
-@patch("pathlib.Path.exists")
-def test_load_chi_file_wrong_columns(mock_exists, mock_loadtxt):
-    """Test error handling for wrong number of columns."""
-    mock_exists.return_value = True
-    mock_loadtxt.return_value = np.array([[1.0, 2.0, 3.0]])  # 3 columns
-
-    with pytest.raises(ValueError, match="Expected 2 columns, got 3"):
-        load_chi_file("test.chi")
-
-
-@patch("numpy.loadtxt")
+    # Verify pandas.read_csv was called correctly
+    mock_read_csv.assert_called_once()
+    args, kwargs = mock_read_csv.call_args
+    assert kwargs.get("comment") == "#"
+    assert kwargs.get("engine") == "c"
+
+
+@pytest.mark.parametrize(
+    ("read_result", "match"),
+    [
+        (pd.DataFrame([[1.0, 2.0, 3.0]]), "Expected 2 columns, got 3"),
+        (Exception("Parse error"), "Failed to parse.*Parse error"),
+    ],
+    ids=["wrong_columns", "parse_error"],
+)
+@patch("pandas.read_csv")
 @patch("pathlib.Path.exists")
-def test_load_chi_file_parse_error(mock_exists, mock_loadtxt):
-    """Test error handling for file parsing failures."""
+def test_load_chi_file_errors(mock_exists, mock_read_csv, read_result, match):
+    """Test error handling for wrong column counts and parsing failures."""
     mock_exists.return_value = True
-    mock_loadtxt.side_effect = Exception("Parse error")
+    if isinstance(read_result, Exception):
+        mock_read_csv.side_effect = read_result
+    else:
+        mock_read_csv.return_value = read_result
 
-    with pytest.raises(ValueError, match="Failed to parse.*Parse error"):
+    with pytest.raises(ValueError, match=match):
         load_chi_file("test.chi")
 
 
@@ -85,3 +93,73 @@ def test_load_diffraction_file_unsupported():
     """Test error for unsupported file formats."""
     with pytest.raises(ValueError, match="Unsupported file format.*\\.txt"):
         load_diffraction_file("test.txt")
+
+
+def test_load_chi_file_nan_values(tmp_path):
+    """Test that literal NaN fields load as NaN, as np.loadtxt did."""
+    chi_file = tmp_path / "pattern.chi"
+    chi_file.write_text("# Q I\n1.0 10.0\n2.0 nan\n3.0 NaN\n4.0 inf\n")
+
+    data = load_chi_file(chi_file)
+
+    np.testing.assert_array_equal(data.q_values, [1.0, 2.0, 3.0, 4.0])
+    np.testing.assert_array_equal(data.intensities, [10.0, np.nan, np.nan, np.inf])
+
+
+def test_load_chi_file_parse_cache(tmp_path):
+    """Test that repeated loads reuse parsed arrays until the file changes."""
+    chi_file = tmp_path / "pattern.chi"
+    chi_file.write_text("# Q I\n1.0 10.0\n2.0 20.0\n")
+
+    hits = _parse_chi_cached.cache_info().hits
+    first = load_chi_file(chi_file)
+    second = load_chi_file(chi_file)
+    assert _parse_chi_cached.cache_info().hits == hits + 1
+
+    # Each load gets its own writable arrays
+    assert not np.shares_memory(first.q_values, second.q_values)
+    second.intensities -= 5.0
+    np.testing.assert_array_equal(first.intensities, [10.0, 20.0])
+    np.testing.assert_array_equal(load_chi_file(chi_file).intensities, [10.0, 20.0])
+
+    chi_file.write_text("# Q I\n1.0 10.0\n2.0 20.0\n3.0 30.0\n")
+    edited = load_chi_file(chi_file)
+
+    np.testing.assert_array_equal(edited.intensities, [10.0, 20.0, 30.0])
+
+
+def test_load_many_preserves_order(tmp_path):
+    """Test concurrent loading of mixed formats, in input order."""
+    paths = []
+    for i, suffix in enumerate([".chi", ".xy", ".chi"]):
+        path = tmp_path / f"pattern_{i}{suffix}"
+        path.write_text(f"1.0 {i}.0\n2.0 {i}.5\n")
+        paths.append(path)
+
+    loaded = load_many(paths, max_workers=2)
+
+    assert [data.filename for data in loaded] == [path.name for path in paths]
+    assert [data.intensities[0] for data in loaded] == [0.0, 1.0, 2.0]
+
+    with pytest.raises(ValueError, match="Unsupported file format"):
+        load_many([tmp_path / "pattern.xyz"])
+
+
+def test_load_test_data_npy_cache(tmp_path, monkeypatch):
+    """Test that the test dataset is cached as .npy in the user cache dir."""
+    chi_file = Path(__file__).parents[1] / "examples" / "pdf_SRM_660b_q.chi"
+    if not chi_file.exists():
+        pytest.skip(f"Test data file not found: {chi_file}")
+    monkeypatch.setenv("ROBOMAGE_CACHE_DIR", str(tmp_path / "cache"))
+
+    reference = load_chi_file(chi_file)
+    load_test_data()  # creates the cache
+    cached = load_test_data()
+
+    assert len(list((tmp_path / "cache").glob("pdf_SRM_660b_q-*.npy"))) == 1
+    assert not chi_file.with_suffix(".npy").exists()
+    assert type(cached.q_values) is np.ndarray
+    assert cached.intensities.flags.writeable
+    assert cached.filename == reference.filename
+    np.testing.assert_array_equal(cached.q_values, reference.q_values)
+    np.testing.assert_array_equal(cached.intensities, reference.intensities)
@@ -3,6 +3,7 @@
 from datetime import datetime
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from robomage.data.models import DataStatistics, DiffractionData
@@ -69,6 +70,104 @@ def test_diffraction_data_sorting():
     np.testing.assert_array_equal(data.q_values, expected_q)
     np.testing.assert_array_equal(data.intensities, expected_i)
 
+    # Sorted columns share one block, each a contiguous view
+    assert data.q_values.base is data.intensities.base
+    assert data.q_values.flags.c_contiguous
+    assert data.intensities.flags.c_contiguous
+
+    # Repeated Q points keep their original order
+    repeated = DiffractionData(
+        q_values=np.array([2.0, 1.0, 2.0, 1.0]),
+        intensities=np.array([30.0, 10.0, 40.0, 20.0]),
+    )
+    np.testing.assert_array_equal(repeated.intensities, [10.0, 20.0, 30.0, 40.0])
+
+    # Mixed dtypes are sorted separately and keep their own dtype
+    mixed = DiffractionData(q_values=q_values, intensities=np.array([3, 1, 2]))
+    np.testing.assert_array_equal(mixed.intensities, [1, 2, 3])
+    assert mixed.intensities.dtype.kind == "i"
+
+
+def test_sortedness_check():
+    """Test the sortedness kernel, including across block boundaries."""
+    from robomage.data import _kernels
+
+    q_values = np.linspace(1.0, 10.0, 3 * _kernels._CHUNK)
+    assert _kernels.is_sorted(q_values)
+    assert _kernels.is_sorted(np.array([1.0, 1.0, 2.0]))
+    assert _kernels.is_sorted(np.array([1, 2, 3]))
+
+    # Out-of-order pair straddling a block boundary
+    unsorted = q_values.copy()
+    unsorted[_kernels._CHUNK] = 0.0
+    assert not _kernels.is_sorted(unsorted)
+    assert not _kernels._is_sorted_loop(unsorted)
+
+    # NaNs count as out of order, so the model falls back to argsort
+    assert not _kernels.is_sorted(np.array([1.0, np.nan, 2.0]))
+
+
+def test_fused_statistics_kernel():
+    """Test that the fused statistics loop matches the NumPy reductions."""
+    from robomage.data import _kernels
+
+    rng = np.random.default_rng(0)
+    q_values = np.sort(rng.uniform(1.0, 10.0, 500))
+    intensities = rng.exponential(100.0, 500)
+
+    np.testing.assert_allclose(
+        _kernels._pattern_stats_loop(q_values, intensities),
+        _kernels.pattern_stats(q_values, intensities),
+        rtol=1e-9,
+    )
+
+    # float32 input is accumulated in float64
+    single_precision = intensities.astype(np.float32)
+    np.testing.assert_allclose(
+        _kernels.pattern_stats(q_values, single_precision),
+        _kernels.pattern_stats(q_values, single_precision.astype(np.float64)),
+        rtol=1e-12,
+    )
+
+    integer = _kernels.pattern_stats(np.array([1, 2, 4]), np.array([1, 2, 6]))
+    np.testing.assert_allclose(integer[4:], (3.0, np.sqrt(14 / 3), 1.5, 0.5))
+
+    single = _kernels.pattern_stats(np.array([1.0]), np.array([5.0]))
+    assert single[:6] == (1.0, 1.0, 5.0, 5.0, 5.0, 0.0)
+    assert np.isnan(single[6]) and np.isnan(single[7])
+
+
+def test_fused_statistics_kernel_nan(monkeypatch):
+    """Test that NaNs propagate the same way with and without numba."""
+    from robomage.data import _kernels
+
+    q_values = np.array([1.0, 2.0, 3.0, 4.0])
+    intensities = np.array([1.0, np.nan, 3.0, 0.5])
+    cases = [
+        (q_values, intensities),
+        (np.array([1.0, 2.0, 3.0, np.nan]), np.array([1.0, 2.0, 3.0, 0.5])),
+        (np.array([np.nan, 2.0, 3.0, 4.0]), np.array([1.0, 2.0, 3.0, 0.5])),
+        (np.array([1.0, np.nan, 3.0, 4.0]), np.array([1.0, 2.0, 3.0, 0.5])),
+    ]
+
+    loops = [_kernels._pattern_stats_loop]
+    if _kernels.njit is not None:
+        loops.append(_kernels._pattern_stats_jit)
+
+    # Force the NumPy fallback for the reference values
+    monkeypatch.setattr(_kernels, "njit", None)
+    for q, y in cases:
+        expected = _kernels.pattern_stats(q, y)
+        for loop in loops:
+            np.testing.assert_allclose(loop(q, y), expected, rtol=1e-12)
+
+    fallback = _kernels.pattern_stats(q_values, intensities)
+    assert np.isnan(fallback[2]) and np.isnan(fallback[3])
+
+    # A NaN inside Q makes both Q step statistics NaN, like np.diff
+    interior = _kernels.pattern_stats(np.array([1.0, np.nan, 3.0, 4.0]), intensities)
+    assert np.isnan(interior[6]) and np.isnan(interior[7])
+
 
 def test_statistics_computation():
     """Test statistical summary computation."""
@@ -87,6 +186,23 @@ def test_statistics_computation():
     assert stats.intensity_mean == 187.5
 
 
+def test_statistics_cached():
+    """Test that statistics are cached and reset when the arrays change."""
+    data = DiffractionData(
+        q_values=np.array([1.0, 2.0, 3.0]), intensities=np.array([1.0, 2.0, 3.0])
+    )
+
+    stats = data.statistics
+    assert data.statistics is stats
+    assert data.model_dump()["statistics"]["num_points"] == 3
+
+    data.q_values = np.array([1.0, 2.0, 5.0])
+    assert data.statistics.q_range == (1.0, 5.0)
+
+    copied = data.model_copy(update={"intensities": np.array([0.0, 0.0, 9.0])})
+    assert copied.statistics.intensity_range == (0.0, 9.0)
+
+
 def test_dataframe_conversion():
     """Test conversion to and from pandas DataFrame."""
     q_values = np.array([1.0, 2.0, 3.0])
@@ -108,6 +224,44 @@ def test_dataframe_conversion():
     assert data2.filename == "test.chi"
 
 
+def test_dataframe_zero_copy():
+    """Test the zero-copy DataFrame conversions."""
+    data = DiffractionData(
+        q_values=np.array([1.0, 2.0, 3.0]), intensities=np.array([10.0, 20.0, 30.0])
+    )
+
+    view = data.to_dataframe(copy=False)
+    copied = data.to_dataframe()
+
+    assert np.shares_memory(view["Q"].to_numpy(), data.q_values)
+    assert not np.shares_memory(copied["Q"].to_numpy(), data.q_values)
+
+    # from_dataframe views NumPy-backed columns instead of copying them
+    restored = DiffractionData.from_dataframe(copied)
+    assert np.shares_memory(restored.q_values, copied["Q"].to_numpy())
+
+    # Strided columns (a frame viewing a row-major 2-D array) are made
+    # contiguous
+    rows = np.column_stack([data.q_values, data.intensities])
+    strided = pd.DataFrame(rows, columns=["Q", "intensity"], copy=False)
+    from_rows = DiffractionData.from_dataframe(strided)
+    assert from_rows.q_values.flags.c_contiguous
+    assert from_rows.intensities.flags.c_contiguous
+    np.testing.assert_array_equal(from_rows.intensities, data.intensities)
+
+
+def test_dataframe_arrow_backed():
+    """Test from_dataframe with pyarrow-backed columns."""
+    pytest.importorskip("pyarrow")
+
+    df = pd.DataFrame({"Q": [1.0, 2.0, 3.0], "intensity": [10.0, 20.0, 30.0]})
+    data = DiffractionData.from_dataframe(df.astype("float64[pyarrow]"))
+
+    assert data.q_values.dtype == np.float64
+    assert data.q_values.flags.c_contiguous
+    np.testing.assert_array_equal(data.intensities, [10.0, 20.0, 30.0])
+
+
 def test_trim_q_range():
     """Test Q range trimming functionality."""
     q_values = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
@@ -124,6 +278,10 @@ def test_trim_q_range():
     np.testing.assert_array_equal(trimmed.q_values, expected_q)
     np.testing.assert_array_equal(trimmed.intensities, expected_i)
 
+    # An empty range is still rejected
+    with pytest.raises(ValueError, match="cannot be empty"):
+        data.trim_q_range(q_min=4.5, q_max=4.6)
+
 
 def test_interpolation():
     """Test data interpolation functionality."""
@@ -139,4 +297,4 @@ def test_interpolation():
     expected_i = np.array([150.0, 250.0])  # Linear interpolation
 
     np.testing.assert_array_equal(interpolated.q_values, new_q)
-    np.testing.assert_array_equal(interpolated.intensities, expected_i)
+    np.testing.assert_allclose(interpolated.intensities, expected_i, rtol=1e-12)
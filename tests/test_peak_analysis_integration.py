@@ -7,11 +7,15 @@ client library, and CLI functionality.
 
 import json
 import subprocess
+import sys
 import tempfile
+import threading
 from pathlib import Path
 
 import numpy as np
 import pytest
+from peak_analysis.engine import PeakAnalysisEngine
+from peak_analysis.models import AnalysisConfig, DiffractionDataInput
 
 from robomage.clients.peak_analysis_client import (
     PeakAnalysisClient,
@@ -29,23 +33,18 @@ def sample_diffraction_data():
     # Background
     background = 100 + 50 * np.exp(-q_values / 5)
 
-    # Add some peaks
-    peaks = [
-        (2.5, 1000, 0.1),  # position, height, width
-        (4.0, 800, 0.15),
-        (6.5, 600, 0.12),
-        (8.0, 400, 0.18),
-    ]
+    # Add some peaks, evaluated together on a (points, peaks) grid
+    positions = np.array([2.5, 4.0, 6.5, 8.0])
+    heights = np.array([1000.0, 800.0, 600.0, 400.0])
+    widths = np.array([0.1, 0.15, 0.12, 0.18])
 
-    intensities = background.copy()
-    for pos, height, width in peaks:
-        peak = height * np.exp(-0.5 * ((q_values - pos) / width) ** 2)
-        intensities += peak
+    offsets = (q_values[:, None] - positions) / widths
+    intensities = background + np.exp(-0.5 * offsets**2) @ heights
 
-    # Add some noise
-    noise = np.random.normal(0, 20, len(q_values))
-    intensities += noise
-    intensities = np.maximum(intensities, 0)  # Ensure non-negative
+    # Add some (reproducible) noise
+    rng = np.random.default_rng(0)
+    intensities += rng.normal(0, 20, len(q_values))
+    np.clip(intensities, 0, None, out=intensities)  # Ensure non-negative
 
     return DiffractionData(
         q_values=q_values,
@@ -60,14 +59,6 @@ class TestPeakAnalysisModels:
 
     def test_diffraction_data_input_validation(self):
         """Test DiffractionDataInput validation."""
-        # Import the service models
-        import sys
-
-        services_dir = Path(__file__).parent.parent / "services"
-        sys.path.insert(0, str(services_dir))
-
-        from peak_analysis.models import DiffractionDataInput
-
         # Valid data
         data = DiffractionDataInput(
             q_values=[1.0, 2.0, 3.0],
@@ -81,19 +72,22 @@ class TestPeakAnalysisModels:
         with pytest.raises(ValueError):
             DiffractionDataInput(q_values=[1.0, 2.0], intensities=[100.0, 200.0, 150.0])
 
+        # NumPy arrays are accepted directly
+        data = DiffractionDataInput(
+            q_values=np.array([1.0, 2.0, 3.0]), intensities=np.array([1.0, 2.0, 3.0])
+        )
+        assert data.q_values == [1.0, 2.0, 3.0]
+
+        # Invalid data - non-finite values
+        with pytest.raises(ValueError):
+            DiffractionDataInput(q_values=[1.0, 2.0], intensities=[100.0, np.nan])
+
         # Invalid data - empty arrays
         with pytest.raises(ValueError):
             DiffractionDataInput(q_values=[], intensities=[])
 
     def test_analysis_config_defaults(self):
         """Test default analysis configuration."""
-        import sys
-
-        services_dir = Path(__file__).parent.parent / "services"
-        sys.path.insert(0, str(services_dir))
-
-        from peak_analysis.models import AnalysisConfig
-
         config = AnalysisConfig()
         assert config.detection.min_prominence == 0.01
         assert config.detection.min_distance == 0.1
@@ -108,30 +102,15 @@ class TestPeakAnalysisEngine:
 
     def test_engine_initialization(self):
         """Test engine can be initialized."""
-        import sys
-
-        services_dir = Path(__file__).parent.parent / "services"
-        sys.path.insert(0, str(services_dir))
-
-        from peak_analysis.engine import PeakAnalysisEngine
-
         engine = PeakAnalysisEngine()
         assert engine.version == "1.0.0"
 
     def test_peak_detection(self, sample_diffraction_data):
         """Test peak detection on synthetic data."""
-        import sys
-
-        services_dir = Path(__file__).parent.parent / "services"
-        sys.path.insert(0, str(services_dir))
-
-        from peak_analysis.engine import PeakAnalysisEngine
-        from peak_analysis.models import AnalysisConfig, DiffractionDataInput
-
         # Convert to service format
         data_input = DiffractionDataInput(
-            q_values=sample_diffraction_data.q_values.tolist(),
-            intensities=sample_diffraction_data.intensities.tolist(),
+            q_values=sample_diffraction_data.q_values,
+            intensities=sample_diffraction_data.intensities,
             filename=sample_diffraction_data.filename,
             sample_name=sample_diffraction_data.sample_name,
         )
@@ -156,56 +135,78 @@ class TestPeakAnalysisEngine:
             assert 0 <= peak.r_squared <= 1
 
 
-class TestPeakAnalysisService:
-    """Test the FastAPI service."""
+@pytest.fixture(scope="class")
+def service_url(free_port):
+    """Start the service for testing and return its base URL."""
+    services_dir = Path(__file__).parent.parent / "services" / "peak_analysis"
+    main_py = services_dir / "main.py"
 
-    @pytest.fixture(scope="class")
-    def service_process(self):
-        """Start the service for testing."""
-        services_dir = Path(__file__).parent.parent / "services" / "peak_analysis"
-        main_py = services_dir / "main.py"
-
-        if not main_py.exists():
-            pytest.skip("Service main.py not found")
-
-        # Start service
-        process = subprocess.Popen(
-            ["python", str(main_py), "--port", "8002"],
-            cwd=str(services_dir),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-        )
+    if not main_py.exists():
+        pytest.skip("Service main.py not found")
+
+    # Start service
+    process = subprocess.Popen(
+        [sys.executable, str(main_py), "--port", str(free_port)],
+        cwd=str(services_dir),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1,
+    )
+
+    # Wait for uvicorn to report it is listening (or for the process to
+    # exit) instead of sleeping between HTTP polls. The reader keeps
+    # draining the pipe so the service never blocks on a full buffer
+    started = threading.Event()
 
-        # Wait for service to start
-        client = PeakAnalysisClient("http://127.0.0.1:8002")
-        if not client.wait_for_service(max_wait=15.0):
-            process.terminate()
-            pytest.skip("Service failed to start")
+    def watch_output():
+        for line in process.stdout:
+            if "Uvicorn running on" in line or "Application startup complete" in line:
+                started.set()
+        started.set()
 
-        yield process
+    threading.Thread(target=watch_output, daemon=True).start()
+    started.wait(timeout=15.0)
 
-        # Clean up
+    # Confirm over HTTP; falls back to polling if the log line never appeared
+    service_url = f"http://127.0.0.1:{free_port}"
+    client = PeakAnalysisClient(service_url)
+    if not client.wait_for_service(max_wait=5.0, check_interval=0.1):
         process.terminate()
-        try:
-            process.wait(timeout=5)
-        except subprocess.TimeoutExpired:
-            process.kill()
-            process.wait()
+        pytest.skip("Service failed to start")
+
+    yield service_url
+
+    # Clean up
+    process.terminate()
+    try:
+        process.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
 
-    def test_service_health(self, service_process):
-        """Test service health endpoint."""
-        client = PeakAnalysisClient("http://127.0.0.1:8002")
 
+@pytest.fixture(scope="class")
+def client(service_url):
+    """Client shared by the service tests, reusing one HTTP session."""
+    with PeakAnalysisClient(service_url) as client:
+        yield client
+
+
+@pytest.mark.xdist_group("service")
+class TestPeakAnalysisService:
+    """Test the FastAPI service."""
+
+    def test_service_health(self, client):
+        """Test service health endpoint."""
         health = client.health_check()
         assert health["status"] == "healthy"
         assert health["dependencies_ok"] is True
         assert "version" in health
         assert health["uptime_seconds"] >= 0
 
-    def test_service_analysis(self, service_process, sample_diffraction_data):
+    def test_service_analysis(self, client, sample_diffraction_data):
         """Test service analysis endpoint."""
-        client = PeakAnalysisClient("http://127.0.0.1:8002")
-
         # Perform analysis
         result = client.analyze_peaks(sample_diffraction_data)
 
@@ -232,10 +233,8 @@ class TestPeakAnalysisService:
             assert "area" in peak
             assert "r_squared" in peak
 
-    def test_service_error_handling(self, service_process):
+    def test_service_error_handling(self, client):
         """Test service error handling."""
-        client = PeakAnalysisClient("http://127.0.0.1:8002")
-
         # Test with invalid data
         with pytest.raises(PeakAnalysisServiceError):
             client.analyze_peaks_raw(
@@ -252,7 +251,7 @@ class TestPeakAnalysisCLI:
         cli_script = Path(__file__).parent.parent / "peak_analyzer.py"
 
         result = subprocess.run(
-            ["python", str(cli_script), "--help"],
+            [sys.executable, str(cli_script), "--help"],
             capture_output=True,
             text=True,
             encoding="utf-8",
@@ -272,12 +271,16 @@ class TestPeakAnalysisCLI:
 
         # Create temporary input file
         with tempfile.NamedTemporaryFile(mode="w", suffix=".chi", delete=False) as f:
-            for q, intensity in zip(
-                sample_diffraction_data.q_values,
-                sample_diffraction_data.intensities,
-                strict=True,
-            ):
-                f.write(f"{q:.6f} {intensity:.1f}\n")
+            np.savetxt(
+                f,
+                np.column_stack(
+                    [
+                        sample_diffraction_data.q_values,
+                        sample_diffraction_data.intensities,
+                    ]
+                ),
+                fmt=["%.6f", "%.1f"],
+            )
             temp_file = f.name
 
         try:
@@ -285,7 +288,13 @@ class TestPeakAnalysisCLI:
             with tempfile.TemporaryDirectory() as output_dir:
                 # Run CLI analysis
                 result = subprocess.run(
-                    ["python", str(cli_script), temp_file, "--output", output_dir],
+                    [
+                        sys.executable,
+                        str(cli_script),
+                        temp_file,
+                        "--output",
+                        output_dir,
+                    ],
                     capture_output=True,
                     text=True,
                     timeout=30,
@@ -2,6 +2,7 @@
 
 from pathlib import Path
 
+import numpy as np
 import pytest
 
 from robomage.data import load_diffraction_file, load_xy_file
@@ -26,7 +27,7 @@ def test_load_xy_file_direct():
     assert data.statistics.q_range[0] < data.statistics.q_range[1]
 
 
-def test_load_xy_file_via_auto_detection():
+def test_load_xy_file_via_auto_detection(loaded_xy):
     """Test XY file loading via automatic format detection."""
     project_root = Path(__file__).parent.parent
     xy_file = project_root / "detector_5_roi_190-196_19-219_frames_17847-17978.xy"
@@ -35,7 +36,7 @@ def test_load_xy_file_via_auto_detection():
         pytest.skip(f"Test XY file not found: {xy_file}")
 
     # Load using the auto-detection loader
-    data = load_diffraction_file(xy_file)
+    data = loaded_xy(xy_file)
 
     # Verify the data structure
     assert data.filename == xy_file.name
@@ -47,7 +48,20 @@ def test_load_xy_file_via_auto_detection():
     assert data.statistics.intensity_range[0] >= 0
 
 
-def test_xy_file_comparison():
+def test_xy_columns_share_contiguous_buffer(tmp_path):
+    """Test that loaded Q and intensity are contiguous views of one buffer."""
+    xy_file = tmp_path / "pattern.xy"
+    xy_file.write_text("# Q I\n1.0 10.0\n2.0 20.0\n3.0 15.0\n")
+
+    data = load_xy_file(xy_file)
+
+    assert data.q_values.flags["C_CONTIGUOUS"]
+    assert data.intensities.flags["C_CONTIGUOUS"]
+    assert np.shares_memory(data.q_values.base, data.intensities)
+    np.testing.assert_array_equal(data.intensities, [10.0, 20.0, 15.0])
+
+
+def test_xy_file_comparison(loaded_xy):
     """Test that both example XY files can be loaded and compared."""
     project_root = Path(__file__).parent.parent
     xy_file1 = project_root / "detector_5_roi_175-181_18-218_frames_17847-17978.xy"
@@ -56,8 +70,8 @@ def test_xy_file_comparison():
     if not (xy_file1.exists() and xy_file2.exists()):
         pytest.skip("Test XY files not found")
 
-    data1 = load_diffraction_file(xy_file1)
-    data2 = load_diffraction_file(xy_file2)
+    data1 = loaded_xy(xy_file1)
+    data2 = loaded_xy(xy_file2)
 
     # Both should have the same Q range and number of points (same detector setup)
     assert data1.statistics.num_points == data2.statistics.num_points
@@ -76,3 +90,12 @@ def test_xy_file_error_handling():
     # Test unsupported format through auto-detection
     with pytest.raises(ValueError, match="Unsupported file format"):
         load_diffraction_file("test.unsupported")
+
+
+def test_xy_file_nan_values(tmp_path):
+    """Test that NaN fields reach the finite-value check, as with np.loadtxt."""
+    xy_file = tmp_path / "pattern.xy"
+    xy_file.write_text("1.0 10.0\n2.0 nan\n")
+
+    with pytest.raises(ValueError, match="Data contains NaN or infinity values"):
+        load_xy_file(xy_file)